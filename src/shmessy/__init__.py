@@ -1,18 +1,33 @@
-import locale
+import copy
 import logging
+import os
 import time
-from typing import BinaryIO, List, Optional, TextIO, Union
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+from typing import (
+    BinaryIO,
+    ContextManager,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
-from pandas import DataFrame
+from pandas import DataFrame, Series
 
-from .exceptions import exception_router
-from .schema import ShmessySchema
+from .exceptions import FieldCastingException, exception_router
+from .partitions import fix_field_in_partitions
+from .scheduler import TypesScheduler
+from .schema import BadValuesReport, Field, ShmessySchema
 from .types_handler import TypesHandler
 from .utils import (
+    _assemble_df,
     _check_number_of_columns,
     _fix_column_names,
-    _fix_column_names_in_df,
     _fix_column_names_in_shmessy_schema,
     _get_dialect,
     _get_sampled_df,
@@ -34,8 +49,31 @@ class Shmessy:
         fallback_to_null: Optional[bool] = False,
         use_csv_sniffer: Optional[bool] = True,
         fix_column_names: Optional[bool] = False,
+        single_pass_inference: Optional[bool] = False,
+        adaptive_scheduling: Optional[bool] = False,
+        scheduler_stats_path: Optional[str] = None,
+        ipv4_as_uint32: Optional[bool] = False,
+        string_storage: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        cast_workers: Optional[int] = None,
+        partition_rows: Optional[int] = None,
+        typed_read_csv: Optional[bool] = False,
     ) -> None:
-        self.__types_handler = TypesHandler(types_to_ignore=types_to_ignore)
+        self.__scheduler = (
+            TypesScheduler(stats_path=scheduler_stats_path)
+            if adaptive_scheduling or scheduler_stats_path
+            else None
+        )
+        self.__scheduler_stats_path = scheduler_stats_path
+        self.__types_handler = TypesHandler(
+            types_to_ignore=types_to_ignore,
+            single_pass=single_pass_inference,
+            scheduler=self.__scheduler,
+            locale_formatter=locale_formatter,
+            ipv4_as_uint32=ipv4_as_uint32,
+            string_storage=string_storage,
+        )
         self.__sample_size = sample_size
         self.__reader_encoding = reader_encoding
         self.__locale_formatter = locale_formatter
@@ -45,17 +83,24 @@ class Shmessy:
         self.__fallback_to_null = fallback_to_null
         self.__use_csv_sniffer = use_csv_sniffer
         self.__fix_column_names = fix_column_names
+        self.__max_workers = max_workers
+        self.__executor = executor
+        self.__cast_workers = cast_workers
+        self.__partition_rows = partition_rows
+        self.__typed_read_csv = typed_read_csv
 
+        # The last result of infer_schema / fix_schema / read_csv, not thread-safe
         self.__inferred_schema: Optional[ShmessySchema] = None
 
-        locale.setlocale(
-            locale.LC_ALL, f"{self.__locale_formatter}.{self.__reader_encoding}"
-        )
-
     def get_inferred_schema(self) -> ShmessySchema:
         return self.__inferred_schema
 
     def infer_schema(self, df: DataFrame) -> ShmessySchema:
+        inferred_schema = self._infer_schema(df)
+        self.__inferred_schema = inferred_schema
+        return inferred_schema
+
+    def _infer_schema(self, df: DataFrame) -> ShmessySchema:
         _check_number_of_columns(df=df, max_columns_num=self.__max_columns_num)
         start_time = time.time()
         df = _get_sampled_df(
@@ -63,62 +108,334 @@ class Shmessy:
             sample_size=self.__sample_size,
             random_sample=self.__use_random_sample,
         )
-        columns = [
-            self.__types_handler.infer_field(field_name=column, data=df[column].values)
-            for column in df
-        ]
+        columns = self._infer_fields(df)
         infer_duration_ms = int((time.time() - start_time) * 1000)
         inferred_schema = ShmessySchema(
             columns=columns, infer_duration_ms=infer_duration_ms
         )
-        self.__inferred_schema = inferred_schema
+        if self.__scheduler_stats_path:
+            self.__scheduler.save()
         return inferred_schema
 
-    def fix_schema(self, df: DataFrame) -> DataFrame:
+    def _infer_fields(self, df: DataFrame) -> List[Field]:
+        """
+        Infers the columns one after another, or spreads them over the executor / a process pool.
+        The fields are returned in the order of the columns either way.
+        """
+        field_names = list(df.columns)
+        samples = [df[column].values for column in df]
+        if self.__executor or (
+            self.__max_workers and self.__max_workers > 1 and len(field_names) > 1
+        ):
+            with self._executor() as executor:
+                return self._map_fields(executor, field_names, samples)
+
+        return [
+            self.__types_handler.infer_field(field_name=field_name, data=sample)
+            for field_name, sample in zip(field_names, samples)
+        ]
+
+    def _executor(self) -> ContextManager[Executor]:
+        # An executor given by the caller is not shut down
+        if self.__executor:
+            return nullcontext(self.__executor)
+        return ProcessPoolExecutor(max_workers=self.__max_workers)
+
+    def _map_fields(
+        self, executor: Executor, field_names: List[str], samples: List
+    ) -> List[Field]:
+        # Send a few columns per task to save round trips to the workers
+        workers = self.__max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(field_names) // (workers * 4))
+        return list(
+            executor.map(
+                self.__types_handler.infer_field,
+                field_names,
+                samples,
+                chunksize=chunksize,
+            )
+        )
+
+    def _fix_fields(
+        self, columns: List[Series], fields: List[Field], row_offset: int = 0
+    ) -> List[Series]:
+        """
+        Casts the columns one after another, or on a pool of threads (the casting kernels release the GIL).
+        Either way, the exception of the first column (by order) which cannot be casted is raised.
+        """
+        fix_field = partial(
+            self.__types_handler.fix_field,
+            fallback_to_string=self.__fallback_to_string,
+            fallback_to_null=self.__fallback_to_null,
+            row_offset=row_offset,
+        )
+        if self.__partition_rows and (
+            self.__executor or (self.__max_workers and self.__max_workers > 1)
+        ):
+            return self._fix_fields_in_partitions(columns, fields, row_offset)
+        if not self.__cast_workers or self.__cast_workers < 2 or len(columns) < 2:
+            return [
+                fix_field(column=column, inferred_field=field)
+                for column, field in zip(columns, fields)
+            ]
+
+        executor = ThreadPoolExecutor(max_workers=self.__cast_workers)
         try:
-            _check_number_of_columns(df=df, max_columns_num=self.__max_columns_num)
-            fixed_schema = self.infer_schema(df)
+            futures = [
+                executor.submit(fix_field, column=column, inferred_field=field)
+                for column, field in zip(columns, fields)
+            ]
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown(cancel_futures=True)
 
-            for column in fixed_schema.columns:
-                df[column.field_name] = self.__types_handler.fix_field(
-                    column=df[column.field_name],
-                    inferred_field=column,
+    def _fix_fields_in_partitions(
+        self, columns: List[Series], fields: List[Field], row_offset: int
+    ) -> List[Series]:
+        """
+        Casts the columns one after another, the rows of each column are split into
+        partitions of partition_rows rows, which are casted on the executor / a process pool.
+        """
+        with self._executor() as executor:
+            return [
+                fix_field_in_partitions(
+                    types_handler=self.__types_handler,
+                    executor=executor,
+                    column=column,
+                    inferred_field=field,
+                    partition_rows=self.__partition_rows,
                     fallback_to_string=self.__fallback_to_string,
                     fallback_to_null=self.__fallback_to_null,
+                    row_offset=row_offset,
                 )
+                for column, field in zip(columns, fields)
+            ]
+
+    def fix_schema(self, df: DataFrame, inplace: Optional[bool] = True) -> DataFrame:
+        df, fixed_schema = self.infer_and_fix(df, inplace=inplace)
+        self.__inferred_schema = fixed_schema
+        return df
 
+    def infer_and_fix(
+        self, df: DataFrame, inplace: Optional[bool] = True
+    ) -> Tuple[DataFrame, ShmessySchema]:
+        """
+        Same as fix_schema, but returns the schema together with the fixed dataframe
+        instead of keeping it on the instance - Safe to call from multiple threads.
+        With inplace=False the input dataframe is left untouched, the result references
+        its columns which are not casted instead of copying them.
+        """
+        try:
+            _check_number_of_columns(df=df, max_columns_num=self.__max_columns_num)
+            fixed_schema = self._infer_schema(df)
+            fixed_df = self._fix_df(df, fixed_schema.columns, inplace=inplace)
             if self.__fix_column_names:
-                mapping = _fix_column_names(df)
-                df = _fix_column_names_in_df(input_df=df, mapping=mapping)
                 fixed_schema = _fix_column_names_in_shmessy_schema(
-                    input_schema=fixed_schema, mapping=mapping
+                    input_schema=fixed_schema, mapping=_fix_column_names(df)
                 )
+            return fixed_df, fixed_schema
+        except Exception as e:
+            exception_router(e)
+
+    def _fix_df(
+        self, df: DataFrame, fields: List[Field], inplace: bool, row_offset: int = 0
+    ) -> DataFrame:
+        original_columns = [df[field.field_name] for field in fields]
+        fixed_columns = self._fix_fields(original_columns, fields, row_offset)
+        if inplace:
+            for field, original_column, fixed_column in zip(
+                fields, original_columns, fixed_columns
+            ):
+                if fixed_column is not original_column:
+                    df[field.field_name] = fixed_column
 
-            self.__inferred_schema = fixed_schema
+        names = list(df.columns)
+        if self.__fix_column_names:
+            mapping = _fix_column_names(df)
+            names = [mapping[name] for name in names]
+        elif inplace:
             return df
+
+        return _assemble_df(fixed_columns, names, df.index)
+
+    def find_bad_values(self, df: DataFrame) -> List[BadValuesReport]:
+        """
+        Reports all the values which cannot be casted to the inferred types, per column.
+        """
+        try:
+            inferred_schema = self._infer_schema(df)
+            reports = [
+                self.__types_handler.find_bad_values(
+                    column=df[column.field_name], inferred_field=column
+                )
+                for column in inferred_schema.columns
+            ]
+            return [report for report in reports if report]
         except Exception as e:
             exception_router(e)
 
     def read_csv(self, filepath_or_buffer: Union[str, TextIO, BinaryIO]) -> DataFrame:
+        df, fixed_schema = self.infer_and_read_csv(filepath_or_buffer)
+        self.__inferred_schema = fixed_schema
+        return df
+
+    def infer_and_read_csv(
+        self, filepath_or_buffer: Union[str, TextIO, BinaryIO]
+    ) -> Tuple[DataFrame, ShmessySchema]:
+        """
+        Same as read_csv, but returns the schema together with the dataframe - Safe to
+        call from multiple threads.
+        """
         try:
-            dialect = (
-                _get_dialect(
-                    filepath_or_buffer=filepath_or_buffer,
-                    sample_size=self.__sample_size,
-                    reader_encoding=self.__reader_encoding,
-                )
-                if self.__use_csv_sniffer
-                else None
-            )
+            dialect = self._get_dialect(filepath_or_buffer)
+            if self.__typed_read_csv:
+                try:
+                    return self._typed_read_csv(filepath_or_buffer, dialect)
+                except FieldCastingException as e:
+                    # The head of the file is not representative - Infer from a sample of the whole file
+                    logger.debug(f"Could not read the file using the typed read: {e}")
+                    if not isinstance(filepath_or_buffer, str):
+                        filepath_or_buffer.seek(0)
 
             df = pd.read_csv(
                 index_col=False,
                 filepath_or_buffer=filepath_or_buffer,
-                dialect=dialect() if dialect else None,  # noqa
+                dialect=dialect,
                 encoding=self.__reader_encoding,
             )
 
-            return self.fix_schema(df=df)
+            return self.infer_and_fix(df=df, inplace=False)
 
         except Exception as e:
             exception_router(e)
+
+    def _typed_read_csv(
+        self, filepath_or_buffer: Union[str, TextIO, BinaryIO], dialect
+    ) -> Tuple[DataFrame, ShmessySchema]:
+        """
+        Infers the schema from the head of the file, then reads the whole file once while
+        pandas parses the dates using their inferred formats. Only the columns which pandas
+        did not parse as their inferred types are fixed after the read.
+        """
+        head = self._read_csv_head(filepath_or_buffer, dialect)
+        _check_number_of_columns(df=head, max_columns_num=self.__max_columns_num)
+        fixed_schema = self._infer_schema(head)
+
+        date_formats = self.__types_handler.read_csv_date_formats(fixed_schema.columns)
+        df = pd.read_csv(
+            index_col=False,
+            filepath_or_buffer=filepath_or_buffer,
+            dialect=dialect,
+            encoding=self.__reader_encoding,
+            parse_dates=list(date_formats) or None,
+            date_format=date_formats or None,
+        )
+        fixed_df = self._fix_df(df, fixed_schema.columns, inplace=True)
+        if self.__fix_column_names:
+            fixed_schema = _fix_column_names_in_shmessy_schema(
+                input_schema=fixed_schema, mapping=_fix_column_names(df)
+            )
+        return fixed_df, fixed_schema
+
+    def infer_csv_schema(
+        self, filepath_or_buffer: Union[str, TextIO, BinaryIO]
+    ) -> ShmessySchema:
+        """
+        Infers the schema of the file from its first sample_size rows, the rest of the
+        file is not read.
+        """
+        try:
+            head = self._read_csv_head(
+                filepath_or_buffer, self._get_dialect(filepath_or_buffer)
+            )
+            return self.infer_schema(head)
+        except Exception as e:
+            exception_router(e)
+
+    def _read_csv_head(
+        self, filepath_or_buffer: Union[str, TextIO, BinaryIO], dialect
+    ) -> DataFrame:
+        head = pd.read_csv(
+            index_col=False,
+            filepath_or_buffer=filepath_or_buffer,
+            dialect=dialect,
+            encoding=self.__reader_encoding,
+            nrows=self.__sample_size,
+        )
+        if not isinstance(filepath_or_buffer, str):
+            filepath_or_buffer.seek(0)
+        return head
+
+    def read_csv_chunks(
+        self, filepath_or_buffer: Union[str, TextIO, BinaryIO], chunksize: int
+    ) -> Iterator[DataFrame]:
+        """
+        Reads the file chunksize rows at a time, so the whole file is never loaded.
+        The schema is inferred from the first chunk and locked: every chunk is fixed
+        using it (the fallbacks apply per chunk). With fallback_to_null, the columns get
+        the nullable dtype of their type (e.g. Int64) in every chunk. The line numbers in
+        the casting errors refer to the whole file.
+        """
+        try:
+            reader = pd.read_csv(
+                index_col=False,
+                filepath_or_buffer=filepath_or_buffer,
+                dialect=self._get_dialect(filepath_or_buffer),
+                encoding=self.__reader_encoding,
+                chunksize=chunksize,
+            )
+            with reader:
+                locked_schema, row_offset = None, 0
+                for chunk in reader:
+                    if locked_schema is None:
+                        locked_schema = self.infer_schema(chunk)
+                        if self.__fix_column_names:
+                            # The chunks are fixed using the original names
+                            self.__inferred_schema = (
+                                _fix_column_names_in_shmessy_schema(
+                                    input_schema=copy.deepcopy(locked_schema),
+                                    mapping=_fix_column_names(chunk),
+                                )
+                            )
+
+                    fields = locked_schema.columns
+                    nulled_so_far = [field.nulled_values_count for field in fields]
+                    for field in fields:
+                        field.nulled_values_count = None
+                    fixed_chunk = self._fix_df(
+                        chunk, fields, inplace=True, row_offset=row_offset
+                    )
+                    if self.__fallback_to_null:
+                        # The same dtype in every chunk, whether it has nulls or not
+                        for position, field in enumerate(fields):
+                            column = fixed_chunk.iloc[:, position]
+                            nullable_column = self.__types_handler.to_nullable_dtype(
+                                column, field
+                            )
+                            if nullable_column is not column:
+                                fixed_chunk.isetitem(position, nullable_column)
+                    # The running totals, before the consumer gets the chunk
+                    for field, nulled, fixed_field in zip(
+                        fields, nulled_so_far, self.__inferred_schema.columns
+                    ):
+                        if field.nulled_values_count is not None:
+                            field.nulled_values_count += nulled or 0
+                        else:
+                            field.nulled_values_count = nulled
+                        fixed_field.nulled_values_count = field.nulled_values_count
+
+                    row_offset += len(chunk)
+                    yield fixed_chunk
+
+        except Exception as e:
+            exception_router(e)
+
+    def _get_dialect(self, filepath_or_buffer: Union[str, TextIO, BinaryIO]):
+        if not self.__use_csv_sniffer:
+            return None
+        dialect = _get_dialect(
+            filepath_or_buffer=filepath_or_buffer,
+            sample_size=self.__sample_size,
+            reader_encoding=self.__reader_encoding,
+        )
+        return dialect() if dialect else None  # noqa
@@ -0,0 +1,57 @@
+import logging
+from typing import Optional
+
+import numpy as np
+from numpy import ndarray
+from pandas import Series, isna
+
+from .schema import ColumnProfile
+
+logger = logging.getLogger(__name__)
+
+CHAR_CLASSES_REGEX: dict[str, str] = {
+    "digit": r"\d",
+    "alpha": r"[^\W\d_]",
+    "space": r"\s",
+    "punctuation": r"[^\w\s]|_",
+}
+DOT_QUAD_REGEX: str = r"[0-9]{1,3}(?:\.[0-9]{1,3}){3}"
+
+
+def build_column_profile(values: ndarray, counts: ndarray) -> Optional[ColumnProfile]:
+    """
+    Vectorized profile of the distinct sampled values (weighted by their counts).
+    Only string columns are profiled.
+    """
+    if values.dtype.kind not in "OU" and str(values.dtype) != "string":
+        return None
+
+    values = np.asarray(values, dtype=object)
+    nulls = np.asarray(isna(values), dtype=bool)
+    is_string = np.fromiter(
+        (isinstance(value, str) for value in values), dtype=bool, count=len(values)
+    )
+    strings = Series(values[is_string], dtype=object)
+    string_counts = counts[is_string]
+    profile = ColumnProfile(
+        strings_count=int(string_counts.sum()),
+        non_strings_count=int(counts[~is_string & ~nulls].sum()),
+        nulls_count=int(counts[nulls].sum()),
+    )
+    if strings.empty:
+        return profile
+
+    lengths = strings.str.len()
+    profile.min_length = int(lengths.min())
+    profile.max_length = int(lengths.max())
+    profile.char_classes = [
+        char_class
+        for char_class, regex in CHAR_CLASSES_REGEX.items()
+        if strings.str.contains(regex, regex=True).any()
+    ]
+    all_digits = strings.str.isdigit().values
+    profile.digits_share = float(string_counts[all_digits].sum() / string_counts.sum())
+    profile.has_at_sign = bool(strings.str.contains("@", regex=False).any())
+    profile.has_colon = bool(strings.str.contains(":", regex=False).any())
+    profile.has_dot_quad = bool(strings.str.contains(DOT_QUAD_REGEX, regex=True).any())
+    return profile
@@ -1,15 +1,39 @@
+import calendar
+import locale
 import logging
 import math
+import re
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Iterable, Optional
 
+import numpy as np
 from numpy import datetime64, ndarray
-from pandas import Timestamp
+from pandas import Series, Timestamp, to_datetime
 
 from .schema import InferredField
 
 logger = logging.getLogger(__name__)
 
+_VALUE_TOKENS_REGEX = re.compile(r"(\d+)|([^\W\d_]+)|([\W_]+)")
+_PATTERN_TOKENS_REGEX = re.compile(r"%(.)|([^%]+)")
+_WHITESPACES_REGEX = re.compile(r"\s+")
+
+# Numeric directive -> (min value, max value, min digits, max digits) as accepted by strptime
+_NUMERIC_DIRECTIVES: dict[str, tuple[int, int, int, int]] = {
+    "d": (1, 31, 1, 2),
+    "m": (1, 12, 1, 2),
+    "y": (0, 99, 2, 2),
+    "Y": (0, 9999, 4, 4),
+    "H": (0, 23, 1, 2),
+    "I": (1, 12, 1, 2),
+    "M": (0, 59, 1, 2),
+    "S": (0, 61, 1, 2),
+    "f": (0, 999999, 1, 6),
+    "j": (1, 366, 1, 3),
+}
+_ALPHA_DIRECTIVES: set[str] = {"b", "B", "a", "A", "p"}
+
 
 def is_empty_value(value: Any) -> bool:
     if value is None or (isinstance(value, float) and math.isnan(value)):
@@ -27,24 +51,301 @@ def cast_value(value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
     raise Exception("Input type for date/datetime casting must be string.")
 
 
+def _normalize_separator(value: str) -> str:
+    # strptime matches any whitespace in the pattern with one or more whitespaces
+    return _WHITESPACES_REGEX.sub(" ", value)
+
+
+def _tokenize(value: str) -> list[tuple[str, str]]:
+    tokens = []
+    for digits, letters, separator in _VALUE_TOKENS_REGEX.findall(value):
+        if digits:
+            tokens.append(("num", digits))
+        elif letters:
+            tokens.append(("alpha", letters.lower()))
+        else:
+            tokens.append(("sep", _normalize_separator(separator)))
+    return tokens
+
+
+@lru_cache(maxsize=None)
+def _alpha_directive_values(directive: str, time_locale: Any) -> Optional[frozenset]:
+    names = {
+        "b": calendar.month_abbr,
+        "B": calendar.month_name,
+        "a": calendar.day_abbr,
+        "A": calendar.day_name,
+    }.get(directive)
+    if names is None:
+        return None  # AM / PM - Any word is feasible
+    values = frozenset(name.lower() for name in names if name)
+    if not all(value.isalpha() for value in values):
+        return None  # Locale names that our tokenizer splits, do not prune them
+    return values
+
+
+@lru_cache(maxsize=None)
+def _pattern_skeleton(pattern: str) -> Optional[tuple[tuple[str, Any], ...]]:
+    """
+    Break the pattern into the same token kinds as the values.
+    Returns None for patterns whose adjacent fields cannot be told apart by the
+    tokenizer (%Y%m%d for example) - These patterns are never pruned.
+    """
+    skeleton = []
+    for directive, literal in _PATTERN_TOKENS_REGEX.findall(pattern):
+        if directive in _NUMERIC_DIRECTIVES:
+            skeleton.append(("num", _NUMERIC_DIRECTIVES[directive]))
+        elif directive in _ALPHA_DIRECTIVES:
+            skeleton.append(("alpha", directive))
+        elif directive:
+            # Timezones and any other directive - Stop checking from here
+            skeleton.append(("any", directive))
+            break
+        else:
+            for kind, value in _tokenize(literal):
+                if kind == "num":
+                    skeleton.append(
+                        ("num", (int(value), int(value), len(value), len(value)))
+                    )
+                elif kind == "alpha":
+                    skeleton.append(("word", value))
+                else:
+                    skeleton.append(("sep", value))
+
+    kinds = [kind.replace("word", "alpha") for kind, _ in skeleton]
+    if any(previous == current for previous, current in zip(kinds, kinds[1:])):
+        return None
+    return tuple(skeleton)
+
+
+def _value_shapes(values: Iterable[str]) -> dict[tuple, list]:
+    """
+    Group the values by their structure (token kinds and separators) and aggregate
+    each token position: value / length ranges for numbers, the set of words for words.
+    """
+    shapes: dict[tuple, list] = {}
+    for value in values:
+        tokens = _tokenize(value)
+        key = tuple(value if kind == "sep" else kind for kind, value in tokens)
+        stats = shapes.get(key)
+        if stats is None:
+            shapes[key] = stats = [
+                None if kind == "sep" else ([] if kind == "num" else set())
+                for kind, _ in tokens
+            ]
+        for idx, (kind, token) in enumerate(tokens):
+            if kind == "num":
+                stats[idx].append(token)
+            elif kind == "alpha":
+                stats[idx].add(token)
+
+    for stats in shapes.values():
+        for idx, stat in enumerate(stats):
+            if isinstance(stat, list):
+                # Long digit runs cannot be any date field, avoid converting them
+                numbers = [int(token) if len(token) < 10 else 10**9 for token in stat]
+                lengths = [len(token) for token in stat]
+                stats[idx] = (min(numbers), max(numbers), min(lengths), max(lengths))
+    return shapes
+
+
+def _is_separator(token: str) -> bool:
+    return token not in ("num", "alpha")
+
+
+def _fits_shape(skeleton: tuple, shape: tuple, stats: list, time_locale: Any) -> bool:
+    day_spec = _NUMERIC_DIRECTIVES["d"]
+    position = 0
+    for idx, (kind, spec) in enumerate(skeleton):
+        if kind == "any":
+            return True
+
+        is_day = kind == "num" and spec == day_spec
+        if is_day and position < len(shape) and shape[position] == " ":
+            position += 1  # strptime accepts a space-padded day (" 5")
+        if position >= len(shape):
+            return False
+        token = shape[position]
+
+        if kind == "sep":
+            next_token = skeleton[idx + 1] if idx + 1 < len(skeleton) else None
+            if next_token is not None and next_token[0] == "any":
+                # The unchecked directive may start with a sign ("+0200")
+                return _is_separator(token) and token.startswith(spec)
+            if token != spec and not (
+                next_token == ("num", day_spec) and token == spec + " "
+            ):
+                return False
+        elif kind == "num":
+            if token != "num":
+                return False
+            min_value, max_value, min_len, max_len = spec
+            low, high, shortest, longest = stats[position]
+            if (
+                low < min_value
+                or high > max_value
+                or shortest < min_len
+                or longest > max_len
+            ):
+                return False
+        elif kind == "word":
+            if token != "alpha" or stats[position] != {spec}:
+                return False
+        elif kind == "alpha":
+            if token != "alpha":
+                return False
+            feasible_words = _alpha_directive_values(spec, time_locale)
+            if feasible_words is not None and not stats[position] <= feasible_words:
+                return False
+        position += 1
+
+    return position == len(shape)
+
+
+def prune_patterns(values: Iterable[str], patterns: list[str]) -> list[str]:
+    """
+    Keep (in the original order) only the patterns that can structurally match
+    all the given values, so only a handful of patterns reach the actual parsing.
+    """
+    time_locale = locale.getlocale(locale.LC_TIME)
+    candidates = patterns
+    for shape, stats in _value_shapes(values).items():
+        candidates = [
+            pattern
+            for pattern in candidates
+            if _pattern_skeleton(pattern) is None
+            or _fits_shape(_pattern_skeleton(pattern), shape, stats, time_locale)
+        ]
+        if not candidates:
+            break
+    return candidates
+
+
+def _split_sample(data: ndarray) -> Optional[tuple[Series, bool]]:
+    """
+    Split the sample into its string values and a flag telling whether it holds
+    any datetime-like value (datetime64 / Timestamp), which matches every pattern.
+    Returns None if the sample contains a value that cannot be casted at all.
+    """
+    if data.dtype.kind == "M":
+        return Series([], dtype=object), len(data) > 0
+    if data.dtype.kind in "biufc":
+        # Numeric samples may only be empty (all NaN), nothing to match in both cases
+        return None
+
+    strings = []
+    has_datetime_values = False
+    for value in np.asarray(data, dtype=object):
+        if is_empty_value(value):
+            continue
+        if isinstance(value, str):
+            strings.append(value)
+        elif isinstance(value, (datetime64, Timestamp)):
+            has_datetime_values = True
+        else:
+            logger.debug(f"Value '{value}' is not a string, cannot cast to date")
+            return None
+    return Series(strings, dtype=object), has_datetime_values
+
+
+def _match_pattern(values: Series, pattern: str) -> bool:
+    # Reject cheaply using the first value - most of the patterns fail right here
+    try:
+        datetime.strptime(values.iat[0], pattern)
+    except ValueError as e:
+        logger.debug(e)
+        return False
+
+    if "%Z" in pattern:
+        # pandas accepts any timezone name, strptime only UTC / GMT / the local ones
+        unparsed_values = values
+    else:
+        try:
+            parsed = to_datetime(values, format=pattern, errors="coerce", utc=True)
+            # Values pandas could not handle (out of bounds dates for example)
+            # are verified using strptime to keep the original semantics
+            is_unparsed = parsed.isna().values
+            if "%S" in pattern:
+                # pandas rolls the :60 / :61 seconds over to :00 / :01 of the next
+                # minute, while strptime rejects them
+                is_unparsed = is_unparsed | parsed.dt.second.isin((0, 1)).values
+            unparsed_values = values[is_unparsed]
+        except (ValueError, TypeError, OverflowError) as e:
+            logger.debug(f"Cannot vectorize pattern {pattern}: {e}")
+            unparsed_values = values
+
+    for value in unparsed_values:
+        try:
+            datetime.strptime(value, pattern)
+        except ValueError as e:
+            logger.debug(e)
+            return False
+    return True
+
+
+def rejects(data: ndarray, patterns: list[str]) -> bool:
+    sample = _split_sample(data)
+    if sample is None:
+        return True
+    values, _ = sample
+    if values.empty:
+        return False
+    return not any(
+        _match_pattern(values, pattern) for pattern in prune_patterns(values, patterns)
+    )
+
+
 def validate(
     data: ndarray, patterns: list[str], inferred_type: str
 ) -> Optional[InferredField]:
-    for pattern in patterns:
-        valid_pattern = True
-        at_least_single_not_nan_value = False
-        for value in data:
-            try:
-                cast_value(value, pattern)
-                if not is_empty_value(value):
-                    at_least_single_not_nan_value = True
-            except ValueError as e:  # Not match the pattern
-                logger.debug(e)
-                valid_pattern = False
-                break
-            except Exception as e:  # Any other exception
-                logger.debug(e)
-                return None
-
-        if valid_pattern and at_least_single_not_nan_value:
+    sample = _split_sample(data)
+    if sample is None:
+        return None
+
+    values, has_datetime_values = sample
+    if values.empty:
+        if has_datetime_values and patterns:
+            return InferredField(
+                inferred_type=inferred_type, inferred_pattern=patterns[0]
+            )
+        return None
+
+    for pattern in prune_patterns(values, patterns):
+        if _match_pattern(values, pattern):
             return InferredField(inferred_type=inferred_type, inferred_pattern=pattern)
+
+
+def start_validation(patterns: list[str]) -> dict:
+    return {"patterns": patterns, "has_strings": False, "has_datetime_values": False}
+
+
+def validate_chunk(data: ndarray, state: dict) -> bool:
+    """
+    Keep (in their order) only the state "patterns" which match all the string values
+    of the chunk. Returns False once none of them is left.
+    """
+    sample = _split_sample(data)
+    if sample is None:
+        return False
+
+    values, has_datetime_values = sample
+    state["has_datetime_values"] = state["has_datetime_values"] or has_datetime_values
+    if not values.empty:
+        state["has_strings"] = True
+        state["patterns"] = [
+            pattern
+            for pattern in prune_patterns(values, state["patterns"])
+            if _match_pattern(values, pattern)
+        ]
+    return bool(state["patterns"])
+
+
+def finish_validation(state: dict, inferred_type: str) -> Optional[InferredField]:
+    # Same as validate - The first pattern which matched all the values
+    if not state["patterns"]:
+        return None
+    if not state["has_strings"] and not state["has_datetime_values"]:
+        return None
+    return InferredField(
+        inferred_type=inferred_type, inferred_pattern=state["patterns"][0]
+    )
@@ -1,6 +1,8 @@
 import re
 from typing import Any, Optional
 
+from .schema import BadValuesReport
+
 
 def exception_router(exception: Exception):
     error_message = str(exception)
@@ -43,13 +45,25 @@ class FieldCastingException(ShmessyException):
         line_number: int,
         column_name: str,
         pattern: Optional[Any] = None,
+        report: Optional[BadValuesReport] = None,
     ):
+        self.__args = (type_, bad_value, line_number, column_name, pattern, report)
+        self.report = report
         pattern_str = f"[{pattern}]" if pattern else ""
+        total_str = (
+            f" Found {report.bad_values_count:,} bad values in this column."
+            if report and report.bad_values_count > 1
+            else ""
+        )
         super().__init__(
             f'Error in line {line_number:,} for column "{column_name}": '
-            f'Couldn\'t cast value "{bad_value}" to type {type_}{pattern_str}.'
+            f'Couldn\'t cast value "{bad_value}" to type {type_}{pattern_str}.{total_str}'
         )
 
+    def __reduce__(self):
+        # Picklable, for process pools
+        return self.__class__, self.__args
+
 
 class WrongEncodingException(ShmessyException):
     def __init__(self, expected_encoding: str):
@@ -0,0 +1,177 @@
+import locale
+import logging
+from functools import lru_cache
+from threading import Lock
+from typing import Any, NamedTuple, Tuple
+
+import numpy as np
+from numpy import ndarray
+from pandas import Series, notna
+
+logger = logging.getLogger(__name__)
+
+
+class NumericFormat(NamedTuple):
+    thousands_separator: str
+    decimal_point: str
+
+
+DEFAULT_NUMERIC_FORMAT = NumericFormat(thousands_separator=",", decimal_point=".")
+
+# The separators of the common locales (as defined by glibc), other locales are
+# looked up using localeconv()
+LOCALES_NUMERIC_FORMATS: dict[str, NumericFormat] = {
+    "C": NumericFormat(thousands_separator="", decimal_point="."),
+    "POSIX": NumericFormat(thousands_separator="", decimal_point="."),
+    "en_US": DEFAULT_NUMERIC_FORMAT,
+    "en_GB": DEFAULT_NUMERIC_FORMAT,
+    "en_CA": DEFAULT_NUMERIC_FORMAT,
+    "en_AU": DEFAULT_NUMERIC_FORMAT,
+    "he_IL": DEFAULT_NUMERIC_FORMAT,
+    "de_DE": NumericFormat(thousands_separator=".", decimal_point=","),
+    "es_ES": NumericFormat(thousands_separator=".", decimal_point=","),
+    "it_IT": NumericFormat(thousands_separator=".", decimal_point=","),
+    "nl_NL": NumericFormat(thousands_separator=".", decimal_point=","),
+    "pt_BR": NumericFormat(thousands_separator=".", decimal_point=","),
+}
+
+_locale_lock = Lock()
+
+# The syntax int() / float() accept (after delocalize), \s and \d match the same
+# unicode whitespaces and digits as int() / float()
+_DIGITS = r"\d(?:_?\d)*"
+INTEGER_SYNTAX = rf"\s*[+-]?{_DIGITS}\s*"
+FLOAT_SYNTAX = (
+    rf"\s*[+-]?(?:(?:{_DIGITS}\.(?:{_DIGITS})?|\.{_DIGITS}|{_DIGITS})(?:[eE][+-]?{_DIGITS})?"
+    r"|(?i:inf|infinity|nan))\s*"
+)
+
+
+@lru_cache(maxsize=None)
+def get_numeric_format(locale_formatter: str, encoding: str = "UTF-8") -> NumericFormat:
+    if locale_formatter in LOCALES_NUMERIC_FORMATS:
+        return LOCALES_NUMERIC_FORMATS[locale_formatter]
+
+    # The locale is process-global, switch it only for the lookup
+    with _locale_lock:
+        current_locale = locale.setlocale(locale.LC_NUMERIC)
+        try:
+            locale.setlocale(locale.LC_NUMERIC, f"{locale_formatter}.{encoding}")
+            conventions = locale.localeconv()
+        finally:
+            locale.setlocale(locale.LC_NUMERIC, current_locale)
+
+    logger.debug(f"Loaded the numeric format of {locale_formatter}: {conventions}")
+    return NumericFormat(
+        thousands_separator=conventions["thousands_sep"],
+        decimal_point=conventions["decimal_point"],
+    )
+
+
+def delocalize(values: ndarray, numeric_format: NumericFormat) -> ndarray:
+    """
+    Same as locale.delocalize(), applied on the strings of the array (other values are kept as is).
+    """
+    if values.dtype.kind not in "OU":
+        return values
+
+    values = Series(values, dtype=object)
+    strings = values
+    try:
+        if numeric_format.thousands_separator:
+            strings = strings.str.replace(
+                numeric_format.thousands_separator, "", regex=False
+            )
+        if numeric_format.decimal_point != ".":
+            strings = strings.str.replace(
+                numeric_format.decimal_point, ".", regex=False
+            )
+    except AttributeError:  # No strings at all
+        return values.to_numpy(dtype=object)
+
+    # The str accessor returns nan for non-string values
+    return strings.where(strings.notna(), values).to_numpy(dtype=object)
+
+
+def parse_value(value: Any, numeric_format: NumericFormat, integer: bool) -> Any:
+    """
+    Same as locale.atoi() / locale.atof() for strings, int() / float() for other values.
+    """
+    if isinstance(value, str):
+        if numeric_format.thousands_separator:
+            value = value.replace(numeric_format.thousands_separator, "")
+        value = value.replace(numeric_format.decimal_point, ".")
+    return int(value) if integer else float(value)
+
+
+def to_numbers(
+    values: ndarray, numeric_format: NumericFormat, integer: bool
+) -> ndarray:
+    """
+    Vectorized parse_value(), numpy calls int() / float() on each delocalized value.
+    Integers which do not fit int64 are returned as python ints (object array).
+    Raises the error of the first value which cannot be converted.
+    """
+    values = delocalize(values, numeric_format)
+    if not integer and values.dtype.kind == "O" and np.equal(values, None).any():
+        # numpy converts None to nan, float(None) raises
+        raise TypeError(
+            "float() argument must be a string or a real number, not 'NoneType'"
+        )
+    try:
+        return values.astype(np.int64 if integer else np.float64)
+    except OverflowError:
+        if not integer:
+            raise
+    return np.array([int(value) for value in values], dtype=object)
+
+
+def coerce_numbers(
+    values: ndarray, numeric_format: NumericFormat, integer: bool
+) -> Tuple[ndarray, ndarray]:
+    """
+    Vectorized parse_value() which does not fail on bad values, returns the numbers and
+    the mask of the values which were parsed (the other numbers are 0 / nan).
+    Strings are matched against the syntax int() / float() accept before parsing them,
+    other values are parsed one by one.
+    """
+    values = delocalize(values, numeric_format)
+    if values.dtype.kind != "O":
+        is_valid = np.ones(len(values), dtype=bool)
+        if integer and values.dtype.kind in "fc":
+            is_valid = np.isfinite(values)  # int() fails for nan and inf
+    else:
+        is_valid = np.zeros(len(values), dtype=bool)
+        is_string = np.zeros(len(values), dtype=bool)
+        try:
+            matched = Series(values, dtype=object).str.fullmatch(
+                INTEGER_SYNTAX if integer else FLOAT_SYNTAX
+            )
+            is_string = matched.notna().to_numpy()
+            is_valid = matched.eq(True).to_numpy(dtype=bool)
+        except AttributeError:  # No strings at all
+            pass
+        for idx in np.flatnonzero(~is_string & notna(values)):
+            try:
+                parse_value(values[idx], numeric_format, integer)
+                is_valid[idx] = True
+            except Exception:  # noqa
+                pass
+
+    valid_values = values[is_valid]
+    try:
+        parsed = valid_values.astype(np.int64 if integer else np.float64)
+    except OverflowError:
+        parsed = np.array([int(value) for value in valid_values], dtype=object)
+
+    numbers = (
+        np.zeros(len(values), dtype=parsed.dtype)
+        if integer
+        else np.full(len(values), np.nan)
+    )
+    numbers[is_valid] = parsed
+    return numbers, is_valid
+
+
+def out_of_bounds(numbers: ndarray, min_value: int, max_value: int) -> ndarray:
+    return np.asarray((numbers < min_value) | (numbers > max_value), dtype=bool)
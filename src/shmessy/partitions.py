@@ -0,0 +1,194 @@
+import copy
+import logging
+import sys
+from concurrent.futures import Executor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from numpy import ndarray
+from pandas import Series
+
+from .exceptions import FieldCastingException
+from .schema import BadValuesReport, Field
+from .types_handler import TypesHandler
+
+logger = logging.getLogger(__name__)
+
+# Fixed width values are passed to the workers through shared memory, other values are pickled
+SHARED_MEMORY_DTYPE_KINDS = "biufcmM"
+
+
+class SharedPartition(NamedTuple):
+    shared_memory_name: str
+    dtype: str
+    start: int
+    end: int
+
+
+def _attach_shared_memory(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        # Only the process which created the block should unlink it
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+def _fix_partition(
+    types_handler: TypesHandler,
+    inferred_field: Field,
+    fallback_to_null: bool,
+    column_name: Any,
+    row_offset: int,
+    partition: Union[ndarray, SharedPartition],
+) -> Tuple[Series, Optional[int]]:
+    """
+    Runs in the worker - Casts the rows of a single partition.
+    Returns the casted partition and the number of values casted to null.
+    """
+    shared_memory = None
+    if isinstance(partition, SharedPartition):
+        shared_memory = _attach_shared_memory(partition.shared_memory_name)
+        dtype = np.dtype(partition.dtype)
+        values = np.ndarray(
+            shape=(partition.end - partition.start,),
+            dtype=dtype,
+            buffer=shared_memory.buf,
+            offset=partition.start * dtype.itemsize,
+        )
+    else:
+        values = partition
+
+    # The partitions may share the field (thread executors), the count is kept per partition
+    inferred_field = copy.copy(inferred_field)
+    inferred_field.nulled_values_count = None
+    try:
+        fixed_column = types_handler.fix_field(
+            column=Series(values, name=column_name, copy=False),
+            inferred_field=inferred_field,
+            fallback_to_string=False,
+            fallback_to_null=fallback_to_null,
+            row_offset=row_offset,
+        )
+        if shared_memory and np.shares_memory(fixed_column.to_numpy(), values):
+            fixed_column = fixed_column.copy()  # The block is closed below
+        return fixed_column, inferred_field.nulled_values_count
+    finally:
+        del values
+        if shared_memory:
+            shared_memory.close()
+
+
+def _merge_exceptions(
+    exceptions: List[FieldCastingException], sample_size: int
+) -> FieldCastingException:
+    """
+    A single exception for all the partitions which could not be casted, by rows order.
+    """
+    reports = [exception.report for exception in exceptions]
+    first = reports[0]
+    report = BadValuesReport(
+        column_name=first.column_name,
+        inferred_type=first.inferred_type,
+        inferred_pattern=first.inferred_pattern,
+        bad_values_count=sum(x.bad_values_count for x in reports),
+        line_numbers=[line for x in reports for line in x.line_numbers][:sample_size],
+        bad_values=[value for x in reports for value in x.bad_values][:sample_size],
+    )
+    return FieldCastingException(
+        type_=report.inferred_type,
+        bad_value=report.bad_values[0],
+        line_number=report.line_numbers[0],
+        column_name=report.column_name,
+        pattern=report.inferred_pattern,
+        report=report,
+    )
+
+
+def fix_field_in_partitions(
+    types_handler: TypesHandler,
+    executor: Executor,
+    column: Series,
+    inferred_field: Field,
+    partition_rows: int,
+    fallback_to_string: bool,
+    fallback_to_null: bool,
+    row_offset: int = 0,
+) -> Series:
+    """
+    Same as TypesHandler.fix_field, but the rows are split into partitions which are
+    casted on the executor, then concatenated back in order (with the original index).
+    """
+    if len(column) <= partition_rows or not types_handler.is_cast_needed(
+        column, inferred_field
+    ):
+        return types_handler.fix_field(
+            column=column,
+            inferred_field=inferred_field,
+            fallback_to_string=fallback_to_string,
+            fallback_to_null=fallback_to_null,
+            row_offset=row_offset,
+        )
+
+    values = column.to_numpy()
+    bounds = [
+        (start, min(start + partition_rows, len(values)))
+        for start in range(0, len(values), partition_rows)
+    ]
+    shared_memory = None
+    if values.dtype.kind in SHARED_MEMORY_DTYPE_KINDS:
+        shared_memory = SharedMemory(create=True, size=values.nbytes)
+        shared_values = np.ndarray(
+            values.shape, dtype=values.dtype, buffer=shared_memory.buf
+        )
+        shared_values[:] = values
+        del shared_values
+        partitions = [
+            SharedPartition(shared_memory.name, values.dtype.str, start, end)
+            for start, end in bounds
+        ]
+    else:
+        partitions = [values[start:end] for start, end in bounds]
+
+    logger.debug(f"Casting column {column.name} in {len(partitions)} partitions")
+    # Same as fix_field - The fallback to string of the whole column comes first
+    fallback_to_null = fallback_to_null and not fallback_to_string
+    futures = [
+        executor.submit(
+            _fix_partition,
+            types_handler,
+            inferred_field,
+            fallback_to_null,
+            column.name,
+            row_offset + start,
+            partition,
+        )
+        for (start, _), partition in zip(bounds, partitions)
+    ]
+    results, exceptions = [], []
+    try:
+        for future in futures:
+            try:
+                results.append(future.result())
+            except FieldCastingException as e:
+                exceptions.append(e)
+    finally:
+        for future in futures:
+            future.cancel()
+        if shared_memory:
+            shared_memory.close()
+            shared_memory.unlink()
+
+    if exceptions:
+        logger.debug(exceptions[0])
+        if fallback_to_string:
+            return types_handler.fix_field_as_string(column, inferred_field)
+        raise _merge_exceptions(exceptions, types_handler.BAD_VALUES_SAMPLE_SIZE)
+
+    nulled_counts = [count for _, count in results if count is not None]
+    if nulled_counts:
+        inferred_field.nulled_values_count = sum(nulled_counts)
+
+    fixed_column = pd.concat([fixed for fixed, _ in results], ignore_index=True)
+    fixed_column.index = column.index
+    return fixed_column
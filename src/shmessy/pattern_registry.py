@@ -0,0 +1,68 @@
+import json
+import logging
+from collections import Counter
+from threading import Lock
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+class PatternRegistry:
+    """
+    Pattern tables, built once per process, together with the number of times
+    each pattern was matched.
+    A table is a list of pattern groups. Patterns of the same group can never match
+    the same value, so inside a group they are ordered by their hit count.
+    The order of the groups themselves is kept as is since it defines the
+    precedence between ambiguous patterns (%m/%d/%Y vs %d/%m/%Y).
+    """
+
+    def __init__(self) -> None:
+        self.__groups: Dict[str, List[List[str]]] = {}
+        self.__ordered_patterns: Dict[str, List[str]] = {}
+        self.__hits: Dict[str, Counter] = {}
+        self.__lock = Lock()
+
+    def get_patterns(
+        self, table: str, build_groups: Callable[[], List[List[str]]]
+    ) -> List[str]:
+        patterns = self.__ordered_patterns.get(table)
+        if patterns is None:
+            with self.__lock:
+                if table not in self.__groups:
+                    self.__groups[table] = build_groups()
+                patterns = self.__order_patterns(table)
+                self.__ordered_patterns[table] = patterns
+        return patterns
+
+    def __order_patterns(self, table: str) -> List[str]:
+        hits = self.__hits.get(table, Counter())
+        patterns = []
+        for group in self.__groups[table]:
+            # sorted() is stable - Patterns without hits keep their original order
+            patterns += sorted(group, key=lambda pattern: -hits[pattern])
+        return patterns
+
+    def record_hit(self, table: str, pattern: str) -> None:
+        with self.__lock:
+            self.__hits.setdefault(table, Counter())[pattern] += 1
+            self.__ordered_patterns.pop(table, None)
+
+    def get_hit_counts(self) -> Dict[str, Dict[str, int]]:
+        with self.__lock:
+            return {table: dict(hits) for table, hits in self.__hits.items()}
+
+    def save(self, path: str) -> None:
+        with open(path, mode="wt", encoding="UTF-8") as output_file:
+            json.dump(self.get_hit_counts(), output_file, indent=4)
+
+    def load(self, path: str) -> None:
+        with open(path, mode="rt", encoding="UTF-8") as input_file:
+            hit_counts = json.load(input_file)
+        with self.__lock:
+            self.__hits = {table: Counter(hits) for table, hits in hit_counts.items()}
+            self.__ordered_patterns.clear()
+        logger.debug(f"Loaded pattern hit counts from {path}")
+
+
+pattern_registry = PatternRegistry()
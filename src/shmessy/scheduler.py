@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+from threading import Lock, get_ident
+from typing import Dict, List, Optional
+
+from .types.base import BaseType
+
+logger = logging.getLogger(__name__)
+
+STATS_KEYS = [
+    "checks",
+    "useful_checks",
+    "check_seconds",
+    "validations",
+    "validation_seconds",
+]
+
+
+class TypesScheduler:
+    """
+    Decides which cheap rejection checks (BaseType.rejects) run before the types are
+    validated, and in which order, based on statistics measured on live data.
+    A check is useful if it rejected a type which the weight cascade would have validated,
+    it runs only while it saves more validation time than it costs.
+    The survivors are still validated in weight order, so the inferred types are the same.
+    """
+
+    MIN_CHECKS: int = 10
+    MIN_USEFUL_RATE: float = 0.01
+
+    def __init__(self, stats_path: Optional[str] = None) -> None:
+        # type name -> the STATS_KEYS values
+        self.__stats: Dict[str, List[float]] = {}
+        self.__lock = Lock()
+        self.__stats_path = stats_path
+        if stats_path and os.path.exists(stats_path):
+            self.load(stats_path)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state[f"_{self.__class__.__name__}__lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = Lock()
+
+    def __get(self, type_name: str) -> List[float]:
+        return self.__stats.setdefault(type_name, [0, 0, 0.0, 0, 0.0])
+
+    def __is_worth_checking(self, type_name: str) -> bool:
+        checks, useful_checks, check_seconds, validations, validation_seconds = (
+            self.__get(type_name)
+        )
+        if checks < self.MIN_CHECKS or not validations:
+            return True  # Not measured yet
+        useful_rate = useful_checks / checks
+        return useful_rate * validation_seconds / validations > check_seconds / checks
+
+    def __rank(self, type_name: str) -> float:
+        checks, useful_checks, check_seconds, _, _ = self.__get(type_name)
+        if not checks:
+            return 0.0  # Measure the unknown types first
+        useful_rate = max(useful_checks / checks, self.MIN_USEFUL_RATE)
+        return (check_seconds / checks) / useful_rate
+
+    def order(self, types: List[BaseType]) -> List[BaseType]:
+        """
+        The types worth checking before the validation, cheap and useful checks first.
+        """
+        with self.__lock:
+            return sorted(
+                [x for x in types if self.__is_worth_checking(x.name)],
+                key=lambda x: (self.__rank(x.name), x.weight),
+            )
+
+    def record_check(self, type_name: str, seconds: float, useful: bool) -> None:
+        with self.__lock:
+            stats = self.__get(type_name)
+            stats[0] += 1
+            stats[1] += int(useful)
+            stats[2] += seconds
+
+    def record_validation(self, type_name: str, seconds: float) -> None:
+        with self.__lock:
+            stats = self.__get(type_name)
+            stats[3] += 1
+            stats[4] += seconds
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        with self.__lock:
+            return {
+                type_name: dict(zip(STATS_KEYS, stats))
+                for type_name, stats in self.__stats.items()
+            }
+
+    def save(self, path: Optional[str] = None) -> None:
+        path = path or self.__stats_path
+        temp_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+        with open(temp_path, mode="wt", encoding="UTF-8") as output_file:
+            json.dump(self.get_stats(), output_file, indent=4)
+        os.replace(temp_path, path)  # Atomic, other processes may read the file
+
+    def load(self, path: str) -> None:
+        with open(path, mode="rt", encoding="UTF-8") as input_file:
+            stats = json.load(input_file)
+        with self.__lock:
+            self.__stats = {
+                type_name: [x[key] for key in STATS_KEYS]
+                for type_name, x in stats.items()
+            }
+        logger.debug(f"Loaded types scheduler stats from {path}")
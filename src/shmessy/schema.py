@@ -13,8 +13,32 @@ class InferredField(BaseModel):
     inferred_pattern: Optional[Any] = None
 
 
+class ColumnProfile(BaseModel):
+    char_classes: List[str] = []
+    min_length: Optional[int] = None
+    max_length: Optional[int] = None
+    digits_share: float = 0.0
+    has_at_sign: bool = False
+    has_colon: bool = False
+    has_dot_quad: bool = False
+    strings_count: int = 0
+    non_strings_count: int = 0
+    nulls_count: int = 0
+    skipped_types: List[str] = []
+
+
 class Field(InferredField, BaseField):
-    pass
+    profile: Optional[ColumnProfile] = None
+    nulled_values_count: Optional[int] = None  # Casted to null by fallback_to_null
+
+
+class BadValuesReport(BaseModel):
+    column_name: str
+    inferred_type: str
+    inferred_pattern: Optional[Any] = None
+    bad_values_count: int
+    line_numbers: List[int]  # Of the first bad values
+    bad_values: List[Any]
 
 
 class ShmessySchema(BaseModel):
@@ -6,7 +6,7 @@ from typing import Any, Optional, Tuple
 from numpy import ndarray
 from pandas import Series
 
-from ..schema import InferredField
+from ..schema import ColumnProfile, InferredField
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,51 @@ class BaseType(ABC):
     def validate(self, data: ndarray) -> Optional[InferredField]:
         pass
 
+    def validate_distinct(
+        self, values: ndarray, counts: ndarray
+    ) -> Optional[InferredField]:
+        """
+        Validate the distinct values of the sample, counts holds the number of
+        occurrences of each value. Override it in case the frequency matters.
+        """
+        return self.validate(values)
+
+    def rejects(self, data: ndarray) -> bool:
+        """
+        Cheap check used to drop candidate types early. Returns True only if the data
+        contains a value that rules out this type for any sample containing it.
+        """
+        return False
+
+    def start_validation(self) -> dict:
+        """
+        The state of validating the sample in chunks (validate_chunk, then finish_validation).
+        """
+        return {}
+
+    def validate_chunk(self, chunk: ndarray, state: dict) -> bool:
+        """
+        Validate the next chunk of the sample and update the state.
+        Returns False if the type cannot match the sample anymore.
+        """
+        return not self.rejects(chunk)
+
+    def finish_validation(
+        self, values: ndarray, counts: ndarray, state: dict
+    ) -> Optional[InferredField]:
+        """
+        The result of the validation once all the chunks were validated. Override it
+        (along with validate_chunk) to decide it without validating the whole sample again.
+        """
+        return self.validate_distinct(values, counts)
+
+    def is_ruled_out(self, profile: ColumnProfile) -> bool:
+        """
+        Returns True if the column profile proves that the column cannot be of this type,
+        the type is skipped without validating the data.
+        """
+        return False
+
     @abstractmethod
     def cast_value(self, value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
         pass
@@ -28,10 +73,34 @@ class BaseType(ABC):
     ) -> Optional[Any]:
         pass
 
+    def cast_column_coerce(
+        self, column: Series, inferred_field: InferredField
+    ) -> Series:
+        """
+        Same as cast_column, but values which cannot be casted become nulls instead
+        of failing the cast. Types without it are casted value by value.
+        """
+        raise NotImplementedError()
+
     @abstractmethod
     def ignore_cast_for_types(self) -> Tuple[Any]:
         pass
 
+    def read_csv_date_format(self, inferred_field: InferredField) -> Optional[str]:
+        """
+        The date_format which makes pd.read_csv parse the column as this type while
+        reading the file. None if the column is fixed after it is read.
+        """
+        return None
+
+    @property
+    def nullable_dtype(self) -> Optional[Any]:
+        """
+        A single dtype for the casted columns, whether they have nulls or not (e.g. Int64).
+        None if the casted columns always get the same dtype.
+        """
+        return None
+
     @property
     def name(self) -> str:
         return str(self.__class__.__name__.replace("Type", ""))
@@ -1,10 +1,11 @@
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple
 
 import numpy as np
 from numpy import ndarray
-from pandas import Series
+from pandas import Series, factorize, isna
+from pandas.api.types import infer_dtype
 
-from ..schema import InferredField
+from ..schema import ColumnProfile, InferredField
 from .base import BaseType
 
 
@@ -19,33 +20,128 @@ class BooleanType(BaseType):
         (1, 0),
     ]
 
-    def _match_bool_pattern(self, data: ndarray, pattern: Tuple) -> bool:
-        match_positive: bool = False
-        match_negative: bool = False
+    def _string_patterns(self) -> Dict[FrozenSet[str], Tuple]:
+        # Lowered (true, false) values of the string patterns
+        return {
+            frozenset(x.lower() for x in pattern): pattern
+            for pattern in self.patterns
+            if isinstance(pattern[0], str)
+        }
 
-        for value in data:
-            try:
-                casted_value = self.cast_value(value, pattern)
-            except ValueError:
-                return False
-            if casted_value is True:
-                match_positive = True
-            else:
-                match_negative = True
+    @staticmethod
+    def _lowered_strings(data: ndarray) -> Optional[Set[str]]:
+        # None in case of any non-string value
+        if infer_dtype(data, skipna=False) != "string":
+            return None
+        return {value.lower() for value in data}
 
-        if match_positive and match_negative:
-            return True
-        return False
+    def is_ruled_out(self, profile: ColumnProfile) -> bool:
+        longest_value = max(len(str(x)) for pattern in self.patterns for x in pattern)
+        return (profile.max_length or 0) > longest_value
+
+    @staticmethod
+    def _numeric_matches(data: ndarray) -> Tuple[ndarray, ndarray]:
+        # Numbers can only match the (1, 0) pattern
+        return data == 1, data == 0
 
     def validate(self, data: ndarray) -> Optional[InferredField]:
         if data.dtype == np.dtype("bool"):
             return InferredField(inferred_type=self.name)
-        for pattern in self.patterns:
-            if self._match_bool_pattern(data, pattern):
+        if data.dtype.kind in "iuf":
+            is_true, is_false = self._numeric_matches(data)
+            if (is_true | is_false).all() and is_true.any() and is_false.any():
+                return InferredField(inferred_type=self.name, inferred_pattern=(1, 0))
+            return None
+        if isna(data).any():
+            return None  # Nulls don't match any pattern
+
+        # All the patterns are checked together - Each pattern must match all the
+        # values, and both the true and false values should appear
+        lowered = self._lowered_strings(data)
+        if lowered is not None:
+            pattern = self._string_patterns().get(frozenset(lowered))
+            if pattern:
                 return InferredField(inferred_type=self.name, inferred_pattern=pattern)
+            return None
+
+        # Numbers (as objects) can only match the (1, 0) pattern
+        is_true, is_false = self._numeric_matches(data)
+        if (is_true | is_false).all() and is_true.any() and is_false.any():
+            return InferredField(inferred_type=self.name, inferred_pattern=(1, 0))
+
+    def rejects(self, data: ndarray) -> bool:
+        if data.dtype == np.dtype("bool"):
+            return False
+        if data.dtype.kind in "iuf":
+            is_true, is_false = self._numeric_matches(data)
+            return not (is_true | is_false).all()
+        if isna(data).any():
+            return True
+        lowered = self._lowered_strings(data)
+        if lowered is not None:
+            return not any(lowered <= x for x in self._string_patterns())
+        is_true, is_false = self._numeric_matches(data)
+        return not (is_true | is_false).all()
+
+    @staticmethod
+    def _match_distinct_values(
+        column: Series, pattern: Tuple
+    ) -> Tuple[ndarray, ndarray, ndarray]:
+        """
+        Factorize the column and match the distinct values to the pattern,
+        returns the codes and the true / false masks of the distinct values.
+        """
+        true_value, false_value = pattern
+        codes, uniques = factorize(column, use_na_sentinel=True)
+        uniques = Series(uniques, dtype=object)
+        if isinstance(true_value, str):
+            try:
+                uniques = uniques.str.lower()  # nan for non-string values
+            except AttributeError:  # No strings at all
+                uniques = Series(np.nan, index=uniques.index, dtype=object)
+            true_value, false_value = true_value.lower(), false_value.lower()
+
+        is_true = (uniques == true_value).to_numpy(dtype=bool)
+        is_false = (uniques == false_value).to_numpy(dtype=bool)
+        return codes, is_true, is_false
+
+    @property
+    def prefer_column_casting(self) -> bool:
+        return True
 
     def cast_column(self, column: Series, inferred_field: InferredField) -> Series:
-        raise NotImplementedError()
+        """
+        Maps the distinct values to booleans, the result is a numpy bool column,
+        or a pandas boolean column (with NA) if the column has nulls.
+        """
+        codes, is_true, is_false = self._match_distinct_values(
+            column, inferred_field.inferred_pattern
+        )
+        if not (is_true | is_false).all():
+            raise ValueError(
+                f"Could not cast the column {column.name} using pattern "
+                f"{inferred_field.inferred_pattern}"
+            )
+
+        result = Series(is_true[codes], index=column.index, name=column.name)
+        is_null = codes == -1
+        if is_null.any():
+            return result.astype("boolean").mask(is_null)
+        return result
+
+    def cast_column_coerce(
+        self, column: Series, inferred_field: InferredField
+    ) -> Series:
+        codes, is_true, is_false = self._match_distinct_values(
+            column, inferred_field.inferred_pattern
+        )
+        # Same as casting value by value - Objects, nulls (nan) included
+        casted_values = np.full(len(is_true) + 1, np.nan, dtype=object)
+        casted_values[:-1][is_true] = True
+        casted_values[:-1][is_false] = False
+        return Series(
+            casted_values.take(codes), index=column.index, name=column.name
+        ).infer_objects()
 
     def cast_value(self, value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
         if pattern is None:
@@ -68,3 +164,7 @@ class BooleanType(BaseType):
 
     def ignore_cast_for_types(self) -> Tuple[Any]:
         return (np.dtype("bool"),)
+
+    @property
+    def nullable_dtype(self) -> Optional[Any]:
+        return "boolean"
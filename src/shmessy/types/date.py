@@ -5,8 +5,16 @@ import numpy as np
 from numpy import ndarray
 from pandas import Series, to_datetime
 
-from ..date_utils import cast_value, validate
-from ..schema import InferredField
+from ..date_utils import (
+    cast_value,
+    finish_validation,
+    rejects,
+    start_validation,
+    validate,
+    validate_chunk,
+)
+from ..pattern_registry import pattern_registry
+from ..schema import ColumnProfile, InferredField
 from .base import BaseType
 
 logger = logging.getLogger(__name__)
@@ -41,29 +49,76 @@ class DateType(BaseType):
     ]
 
     @classmethod
-    def get_patterns(
+    def get_pattern_groups(
         cls,
         include_date_only_patterns: Optional[bool] = True,
         include_static_date_patterns: Optional[bool] = True,
-    ) -> list[str]:
-        # The value returned cannot be set since the order is important!
+    ) -> list[list[str]]:
+        # Patterns of the same group differ only by their delimiter,
+        # so they can never match the same value
         input_patterns: list[list[str]] = cls.dynamic_patterns.copy()
         if include_date_only_patterns:
             input_patterns += cls.date_only_patterns
 
-        results: list[str] = []
-        for pattern in input_patterns:
-            for delimiter in cls.delimiters:
-                results.append(delimiter.join(pattern))
+        results: list[list[str]] = [
+            [delimiter.join(pattern) for delimiter in cls.delimiters]
+            for pattern in input_patterns
+        ]
 
         if include_static_date_patterns:
-            return results + cls.static_patterns
+            return results + [[pattern] for pattern in cls.static_patterns]
         return results
 
+    @classmethod
+    def get_patterns(
+        cls,
+        include_date_only_patterns: Optional[bool] = True,
+        include_static_date_patterns: Optional[bool] = True,
+    ) -> list[str]:
+        # The value returned cannot be set since the order is important!
+        return [
+            pattern
+            for group in cls.get_pattern_groups(
+                include_date_only_patterns, include_static_date_patterns
+            )
+            for pattern in group
+        ]
+
     def validate(self, data: ndarray) -> Optional[InferredField]:
-        return validate(
-            data=data, patterns=self.get_patterns(), inferred_type=self.name
+        inferred = validate(
+            data=data,
+            patterns=pattern_registry.get_patterns(self.name, self.get_pattern_groups),
+            inferred_type=self.name,
         )
+        if inferred:
+            pattern_registry.record_hit(self.name, inferred.inferred_pattern)
+        return inferred
+
+    def is_ruled_out(self, profile: ColumnProfile) -> bool:
+        # All the patterns contain at least a single numeric part
+        return profile.strings_count > 0 and "digit" not in profile.char_classes
+
+    def rejects(self, data: ndarray) -> bool:
+        return rejects(
+            data=data,
+            patterns=pattern_registry.get_patterns(self.name, self.get_pattern_groups),
+        )
+
+    def start_validation(self) -> dict:
+        return start_validation(
+            patterns=pattern_registry.get_patterns(self.name, self.get_pattern_groups)
+        )
+
+    def validate_chunk(self, chunk: ndarray, state: dict) -> bool:
+        return validate_chunk(data=chunk, state=state)
+
+    def finish_validation(
+        self, values: ndarray, counts: ndarray, state: dict
+    ) -> Optional[InferredField]:
+        inferred = finish_validation(state=state, inferred_type=self.name)
+        if inferred:
+            pattern_registry.record_hit(self.name, inferred.inferred_pattern)
+        return inferred
 
     @property
     def prefer_column_casting(self) -> bool:
@@ -72,8 +127,18 @@ class DateType(BaseType):
     def cast_column(self, column: Series, inferred_field: InferredField) -> Series:
         return to_datetime(column, format=inferred_field.inferred_pattern)
 
+    def cast_column_coerce(
+        self, column: Series, inferred_field: InferredField
+    ) -> Series:
+        return to_datetime(
+            column, format=inferred_field.inferred_pattern, errors="coerce"
+        )
+
     def cast_value(self, value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
         return cast_value(value, pattern)
 
     def ignore_cast_for_types(self) -> Tuple[Any]:
         return (np.dtype("datetime64"),)
+
+    def read_csv_date_format(self, inferred_field: InferredField) -> Optional[str]:
+        return inferred_field.inferred_pattern
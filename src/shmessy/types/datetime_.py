@@ -5,8 +5,16 @@ import numpy as np
 from numpy import ndarray
 from pandas import Series, to_datetime
 
-from ..date_utils import cast_value, validate
-from ..schema import InferredField
+from ..date_utils import (
+    cast_value,
+    finish_validation,
+    rejects,
+    start_validation,
+    validate,
+    validate_chunk,
+)
+from ..pattern_registry import pattern_registry
+from ..schema import ColumnProfile, InferredField
 from .base import BaseType
 from .date import DateType
 
@@ -33,21 +41,62 @@ class DatetimeType(BaseType):
     ]
 
     @classmethod
-    def get_patterns(cls) -> list[str]:
-        result: list[str] = []
-        for date in DateType.get_patterns(
+    def get_pattern_groups(cls) -> list[list[str]]:
+        # All the combinations of the same date template can never match the same value
+        result: list[list[str]] = []
+        for dates in DateType.get_pattern_groups(
             include_date_only_patterns=False, include_static_date_patterns=False
         ):
-            for date_time_delimiter in cls.date_time_delimiters:
-                for dynamic_pattern in cls.dynamic_patterns:
-                    result.append(date + date_time_delimiter + dynamic_pattern)
-        return result + cls.static_patterns
+            group: list[str] = []
+            for date in dates:
+                for date_time_delimiter in cls.date_time_delimiters:
+                    for dynamic_pattern in cls.dynamic_patterns:
+                        group.append(date + date_time_delimiter + dynamic_pattern)
+            result.append(group)
+        return result + [[pattern] for pattern in cls.static_patterns]
+
+    @classmethod
+    def get_patterns(cls) -> list[str]:
+        return [pattern for group in cls.get_pattern_groups() for pattern in group]
 
     def validate(self, data: ndarray) -> Optional[InferredField]:
-        return validate(
-            data=data, patterns=self.get_patterns(), inferred_type=self.name
+        inferred = validate(
+            data=data,
+            patterns=pattern_registry.get_patterns(self.name, self.get_pattern_groups),
+            inferred_type=self.name,
+        )
+        if inferred:
+            pattern_registry.record_hit(self.name, inferred.inferred_pattern)
+        return inferred
+
+    def is_ruled_out(self, profile: ColumnProfile) -> bool:
+        # All the patterns contain a time part (HH:MM) and a numeric date part
+        return profile.strings_count > 0 and (
+            not profile.has_colon or "digit" not in profile.char_classes
+        )
+
+    def rejects(self, data: ndarray) -> bool:
+        return rejects(
+            data=data,
+            patterns=pattern_registry.get_patterns(self.name, self.get_pattern_groups),
         )
 
+    def start_validation(self) -> dict:
+        return start_validation(
+            patterns=pattern_registry.get_patterns(self.name, self.get_pattern_groups)
+        )
+
+    def validate_chunk(self, chunk: ndarray, state: dict) -> bool:
+        return validate_chunk(data=chunk, state=state)
+
+    def finish_validation(
+        self, values: ndarray, counts: ndarray, state: dict
+    ) -> Optional[InferredField]:
+        inferred = finish_validation(state=state, inferred_type=self.name)
+        if inferred:
+            pattern_registry.record_hit(self.name, inferred.inferred_pattern)
+        return inferred
+
     @property
     def prefer_column_casting(self) -> bool:
         return True
@@ -55,8 +104,18 @@ class DatetimeType(BaseType):
     def cast_column(self, column: Series, inferred_field: InferredField) -> Series:
         return to_datetime(column, format=inferred_field.inferred_pattern)
 
+    def cast_column_coerce(
+        self, column: Series, inferred_field: InferredField
+    ) -> Series:
+        return to_datetime(
+            column, format=inferred_field.inferred_pattern, errors="coerce"
+        )
+
     def cast_value(self, value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
         return cast_value(value, pattern)
 
     def ignore_cast_for_types(self) -> Tuple[Any]:
         return (np.dtype("datetime64"),)
+
+    def read_csv_date_format(self, inferred_field: InferredField) -> Optional[str]:
+        return inferred_field.inferred_pattern
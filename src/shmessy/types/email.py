@@ -3,10 +3,11 @@ from typing import Any, Optional, Tuple
 
 import numpy as np
 from numpy import ndarray
-from pandas import Series
+from pandas import Series, isna
+from pandas.api.types import infer_dtype
 from pydantic import BaseModel, EmailStr
 
-from ..schema import InferredField
+from ..schema import ColumnProfile, InferredField
 from .base import BaseType
 
 logger = logging.getLogger(__name__)
@@ -18,9 +19,35 @@ class Model(BaseModel):
 
 class EmailType(BaseType):
     weight = 5
+    # Necessary (not sufficient) conditions for a valid email, including the
+    # "Display Name <email>" form - Every valid email matches it
+    LOCAL_ATOM_REGEX: str = r"[^\s<>@.()\[\]\\,;:\"]+"
+    DOMAIN_EDGE_REGEX: str = r"[^\s!-/:-@\[-`{-~]"  # No ASCII punctuation
+    DOMAIN_INNER_REGEX: str = r"[^\s!-,./:-@\[-`{-~]"  # Hyphens are allowed inside
+    DOMAIN_LABEL_REGEX: str = (
+        rf"{DOMAIN_EDGE_REGEX}(?:{DOMAIN_INNER_REGEX}*{DOMAIN_EDGE_REGEX})?"
+    )
+    EMAIL_REGEX: str = (
+        r"\s*(?:[^<>@]*<)?"  # Display name
+        rf"{LOCAL_ATOM_REGEX}(?:\.{LOCAL_ATOM_REGEX})*"  # Local part
+        rf"@{DOMAIN_LABEL_REGEX}(?:\.{DOMAIN_LABEL_REGEX})+"  # Domain
+        r">?\s*"
+    )
+    CONFIRMATION_SIZE: int = 10  # Number of values fully validated by pydantic
+
+    def _match_regex(self, data: ndarray) -> bool:
+        if not len(data):
+            return True
+        if infer_dtype(data, skipna=False) != "string" or isna(data).any():
+            return False
+        return bool(Series(data, dtype=object).str.fullmatch(self.EMAIL_REGEX).all())
 
     def validate(self, data: ndarray) -> Optional[InferredField]:
-        for value in data:
+        if not self._match_regex(data):
+            logger.debug(f"Some of the values cannot be casted to {self.name}")
+            return None
+        confirmation_size = self.CONFIRMATION_SIZE
+        for value in data[:confirmation_size]:
             try:
                 Model(email=value)
             except ValueError:
@@ -28,8 +55,35 @@ class EmailType(BaseType):
                 return None
         return InferredField(inferred_type=self.name)
 
+    def is_ruled_out(self, profile: ColumnProfile) -> bool:
+        # Only strings are valid (nulls included)
+        return (
+            profile.nulls_count > 0
+            or profile.non_strings_count > 0
+            or (profile.strings_count > 0 and not profile.has_at_sign)
+        )
+
+    def rejects(self, data: ndarray) -> bool:
+        return not self._match_regex(data)
+
+    def finish_validation(
+        self, values: ndarray, counts: ndarray, state: dict
+    ) -> Optional[InferredField]:
+        # The chunks matched the regex, only the confirmation is left
+        for value in values[: self.CONFIRMATION_SIZE]:
+            try:
+                Model(email=value)
+            except ValueError:
+                logger.debug(f"Cannot cast the value '{value}' to {self.name}")
+                return None
+        return InferredField(inferred_type=self.name)
+
+    @property
+    def prefer_column_casting(self) -> bool:
+        return True
+
     def cast_column(self, column: Series, inferred_field: InferredField) -> Series:
-        raise NotImplementedError()
+        return column.astype(str)
 
     def cast_value(self, value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
         return str(value)
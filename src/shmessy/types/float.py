@@ -1,11 +1,19 @@
-import locale
 import logging
 from typing import Any, Optional, Tuple
 
 import numpy as np
 from numpy import ndarray
-from pandas import Series
+from pandas import Series, isna
+from pandas.api.types import is_numeric_dtype
 
+from ..numeric_utils import (
+    DEFAULT_NUMERIC_FORMAT,
+    NumericFormat,
+    coerce_numbers,
+    delocalize,
+    parse_value,
+    to_numbers,
+)
 from ..schema import InferredField
 from .base import BaseType
 
@@ -15,19 +23,46 @@ logger = logging.getLogger(__name__)
 class FloatType(BaseType):
     weight = 8
 
+    def __init__(self, numeric_format: NumericFormat = DEFAULT_NUMERIC_FORMAT):
+        self.numeric_format = numeric_format
+
     def validate(self, data: ndarray) -> Optional[InferredField]:
-        at_least_single_not_empty_value: bool = False
-        for value in data:
-            try:
-                self.cast_value(value)
-                if not at_least_single_not_empty_value and not self.is_empty_value(
-                    value
-                ):
-                    at_least_single_not_empty_value = True
-            except Exception:  # noqa
-                logger.debug(f"Cannot cast the value '{value}' to {self.name}")
-                return None
-        if at_least_single_not_empty_value:
+        if data.dtype.kind in "biuf":
+            has_values = (
+                (~np.isnan(data)).any() if data.dtype.kind == "f" else len(data)
+            )
+            return InferredField(inferred_type=self.name) if has_values else None
+        try:
+            to_numbers(data, self.numeric_format, integer=False)
+        except Exception as e:  # noqa
+            logger.debug(f"Cannot cast the values to {self.name}: {e}")
+            return None
+        if not isna(data).all():
+            return InferredField(inferred_type=self.name)
+
+    def rejects(self, data: ndarray) -> bool:
+        if data.dtype.kind in "biuf":
+            return False
+        try:
+            to_numbers(data, self.numeric_format, integer=False)
+        except Exception:  # noqa
+            return True
+        return False
+
+    def validate_chunk(self, chunk: ndarray, state: dict) -> bool:
+        if self.rejects(chunk):
+            return False
+        if chunk.dtype.kind == "f":
+            has_values = (~np.isnan(chunk)).any()
+        else:
+            has_values = chunk.dtype.kind in "biu" or not isna(chunk).all()
+        state["has_values"] = state.get("has_values", False) or has_values
+        return True
+
+    def finish_validation(
+        self, values: ndarray, counts: ndarray, state: dict
+    ) -> Optional[InferredField]:
+        if state.get("has_values"):
             return InferredField(inferred_type=self.name)
 
     @property
@@ -35,12 +70,22 @@ class FloatType(BaseType):
         return True
 
     def cast_column(self, column: Series, inferred_field: InferredField) -> Series:
-        return column.astype(np.float64)
+        if is_numeric_dtype(column):
+            return column.astype(np.float64)
+        return Series(
+            delocalize(column.values, self.numeric_format),
+            index=column.index,
+            name=column.name,
+        ).astype(np.float64)
+
+    def cast_column_coerce(
+        self, column: Series, inferred_field: InferredField
+    ) -> Series:
+        numbers, _ = coerce_numbers(column.values, self.numeric_format, integer=False)
+        return Series(numbers, index=column.index, name=column.name)
 
     def cast_value(self, value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
-        if isinstance(value, str):
-            return float(locale.atof(value))
-        return float(value)
+        return parse_value(value, self.numeric_format, integer=False)
 
     def ignore_cast_for_types(self) -> Tuple[Any]:
         return (np.dtype("float64"),)
@@ -1,4 +1,3 @@
-import locale
 import logging
 from typing import Any, Optional, Tuple
 
@@ -7,7 +6,15 @@ from numpy import ndarray
 from pandas import Series, to_numeric
 from pandas.api.types import is_numeric_dtype
 
-from ..schema import InferredField
+from ..numeric_utils import (
+    DEFAULT_NUMERIC_FORMAT,
+    NumericFormat,
+    coerce_numbers,
+    out_of_bounds,
+    parse_value,
+    to_numbers,
+)
+from ..schema import ColumnProfile, InferredField
 from .base import BaseType
 
 logger = logging.getLogger(__name__)
@@ -18,23 +25,50 @@ class IntegerType(BaseType):
     MAX_BOUNDARY: int = 9223372036854775807  # BIGINT max value
     MIN_BOUNDARY: int = -9223372036854775807  # BIGINT min value
 
-    def validate(self, data: ndarray) -> Optional[InferredField]:
-        for value in data:
-            try:
-                casted_values = self.cast_value(value)
-                if (
-                    casted_values > self.MAX_BOUNDARY
-                    or casted_values < self.MIN_BOUNDARY
-                ):
-                    logger.debug(
-                        f"Value '{value}' does not match to {self.name} boundaries"
-                    )
-                    return None
-            except Exception:  # noqa
-                logger.debug(f"Cannot cast the value '{value}' to {self.name}")
+    def __init__(self, numeric_format: NumericFormat = DEFAULT_NUMERIC_FORMAT):
+        self.numeric_format = numeric_format
+
+    def _validate_numeric(self, data: ndarray) -> Optional[InferredField]:
+        if data.dtype.kind in "iu" and len(data):
+            if data.min() < self.MIN_BOUNDARY or data.max() > self.MAX_BOUNDARY:
+                return None
+        if data.dtype.kind == "f":
+            # int() fails for nan and inf, the float boundaries are -2**63 < x < 2**63
+            if not (np.isfinite(data) & (data > -(2.0**63)) & (data < 2.0**63)).all():
                 return None
         return InferredField(inferred_type=self.name)
 
+    def validate(self, data: ndarray) -> Optional[InferredField]:
+        if data.dtype.kind in "biuf":
+            return self._validate_numeric(data)
+        try:
+            numbers = to_numbers(data, self.numeric_format, integer=True)
+        except Exception as e:  # noqa
+            logger.debug(f"Cannot cast the values to {self.name}: {e}")
+            return None
+        overflow = out_of_bounds(numbers, self.MIN_BOUNDARY, self.MAX_BOUNDARY)
+        if overflow.any():
+            logger.debug(
+                f"{overflow.sum()} values do not match to {self.name} boundaries, "
+                f"for example: {list(data[overflow][:5])}"
+            )
+            return None
+        return InferredField(inferred_type=self.name)
+
+    def is_ruled_out(self, profile: ColumnProfile) -> bool:
+        # int() fails for any string with letters
+        return "alpha" in profile.char_classes
+
+    def rejects(self, data: ndarray) -> bool:
+        # Every value is validated on its own
+        return self.validate(data) is None
+
+    def finish_validation(
+        self, values: ndarray, counts: ndarray, state: dict
+    ) -> Optional[InferredField]:
+        # Every value was validated on its own by the chunks
+        return InferredField(inferred_type=self.name)
+
     @property
     def prefer_column_casting(self) -> bool:
         return True
@@ -42,12 +76,31 @@ class IntegerType(BaseType):
     def cast_column(self, column: Series, inferred_field: InferredField) -> Series:
         if is_numeric_dtype(column):
             return column
-        return to_numeric(column.apply(locale.atoi))
+        return to_numeric(
+            Series(
+                to_numbers(column.values, self.numeric_format, integer=True),
+                index=column.index,
+                name=column.name,
+            )
+        )
+
+    def cast_column_coerce(
+        self, column: Series, inferred_field: InferredField
+    ) -> Series:
+        numbers, is_valid = coerce_numbers(
+            column.values, self.numeric_format, integer=True
+        )
+        numbers = Series(numbers, index=column.index, name=column.name)
+        if is_valid.all():
+            return numbers
+        return numbers.where(is_valid)
 
     def cast_value(self, value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
-        if isinstance(value, str):
-            return int(locale.atoi(value))
-        return int(value)
+        return parse_value(value, self.numeric_format, integer=True)
 
     def ignore_cast_for_types(self) -> Tuple[Any]:
         return (np.dtype("int64"),)
+
+    @property
+    def nullable_dtype(self) -> Optional[Any]:
+        return "Int64"
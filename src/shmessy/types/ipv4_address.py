@@ -3,42 +3,150 @@ from typing import Any, Optional, Tuple
 
 import numpy as np
 from numpy import ndarray
-from pandas import Series
+from pandas import Series, isna
+from pandas.api.types import infer_dtype
 from pydantic import BaseModel
 from pydantic.networks import IPv4Address  # noqa
 
-from ..schema import InferredField
+from ..schema import ColumnProfile, InferredField
 from .base import BaseType
 
 logger = logging.getLogger(__name__)
 
+# Dotted-quad of decimal octets without leading zeros, the range is checked by numpy
+DOTTED_QUAD_REGEX: str = r"(?:0|[1-9][0-9]{0,2})(?:\.(?:0|[1-9][0-9]{0,2})){3}"
+OCTETS_SHIFTS: ndarray = np.array([24, 16, 8, 0], dtype=np.uint32)
+
 
 class Model(BaseModel):
     ip: IPv4Address
 
 
+def _valid_octets(strings: Series) -> Tuple[ndarray, ndarray]:
+    """
+    Mask of the IPv4 addresses, and their (n, 4) octets (zeros for the others).
+    """
+    octets = np.zeros((len(strings), 4), dtype=np.uint32)
+    try:
+        is_valid = strings.str.fullmatch(DOTTED_QUAD_REGEX)
+    except AttributeError:  # No strings at all
+        return np.zeros(len(strings), dtype=bool), octets
+    is_valid = is_valid.fillna(False).to_numpy(dtype=bool)
+    if is_valid.any():
+        octets[is_valid] = (
+            strings[is_valid]
+            .str.split(".", n=3, expand=True)
+            .to_numpy()
+            .astype(np.uint32)
+        )
+        is_valid &= (octets <= 255).all(axis=1)
+    return is_valid, octets
+
+
+def _octets(data: ndarray) -> Optional[ndarray]:
+    """
+    Split the IPv4 addresses into a (n, 4) array of octets,
+    None in case one of the values is not an IPv4 address.
+    """
+    if not len(data):
+        return np.empty((0, 4), dtype=np.uint32)
+    if infer_dtype(data, skipna=False) != "string" or isna(data).any():
+        return None
+    strings = Series(data, dtype=object)
+    if not strings.str.fullmatch(DOTTED_QUAD_REGEX).all():
+        return None
+    octets = strings.str.split(".", n=3, expand=True).to_numpy().astype(np.uint32)
+    if (octets > 255).any():
+        return None
+    return octets
+
+
+def format_ipv4(column: Series) -> Series:
+    """
+    Inverse of the uint32 storage (ipv4_as_uint32) - Formats the numbers as dotted-quad strings.
+    """
+    is_null = column.isna().to_numpy()
+    numbers = column.to_numpy(dtype=np.uint32, na_value=0)
+    octets = ((numbers[:, None] >> OCTETS_SHIFTS) & 0xFF).astype(str)
+    strings = Series(octets[:, 0], dtype=object)
+    for idx in range(1, 4):
+        strings = strings + "." + octets[:, idx]
+    strings[is_null] = None
+    return Series(strings.to_numpy(), index=column.index, name=column.name)
+
+
 class IPv4Type(BaseType):
     weight = 6
 
+    def __init__(self, as_uint32: bool = False):
+        self.as_uint32 = as_uint32
+
     def validate(self, data: ndarray) -> Optional[InferredField]:
-        for value in data:
-            try:
-                if not isinstance(value, str):
-                    logger.debug(
-                        f"Value '{value}' is not string, cannot cast to {self.name}"
-                    )
-                    return None
-                Model(ip=value)
-            except ValueError:
-                logger.debug(f"Cannot cast the value '{value}' to {self.name}")
-                return None
+        if _octets(data) is None:
+            logger.debug(f"Some of the values cannot be casted to {self.name}")
+            return None
         return InferredField(inferred_type=self.name)
 
+    def is_ruled_out(self, profile: ColumnProfile) -> bool:
+        # Only strings are valid (nulls included) - 255.255.255.255 is the longest
+        return (
+            profile.nulls_count > 0
+            or profile.non_strings_count > 0
+            or (profile.strings_count > 0 and not profile.has_dot_quad)
+            or (profile.max_length or 0) > 15
+        )
+
+    def rejects(self, data: ndarray) -> bool:
+        # Every value is validated on its own
+        return self.validate(data) is None
+
+    def finish_validation(
+        self, values: ndarray, counts: ndarray, state: dict
+    ) -> Optional[InferredField]:
+        # Every value was validated on its own by the chunks
+        return InferredField(inferred_type=self.name)
+
+    @property
+    def prefer_column_casting(self) -> bool:
+        return True
+
     def cast_column(self, column: Series, inferred_field: InferredField) -> Series:
-        raise NotImplementedError()
+        if not self.as_uint32:
+            return column.astype(str)
+
+        is_null = column.isna().to_numpy()
+        octets = _octets(column.to_numpy(dtype=object)[~is_null])
+        if octets is None:
+            raise ValueError(f"Column {column.name} has non IPv4 values")
+        numbers = np.zeros(len(column), dtype=np.uint32)
+        numbers[~is_null] = np.bitwise_or.reduce(octets << OCTETS_SHIFTS, axis=1)
+        result = Series(numbers, index=column.index, name=column.name)
+        if is_null.any():
+            return result.astype("UInt32").mask(is_null)
+        return result
+
+    def cast_column_coerce(
+        self, column: Series, inferred_field: InferredField
+    ) -> Series:
+        if not self.as_uint32:
+            return self.cast_column(column, inferred_field)
+        is_valid, octets = _valid_octets(Series(column.to_numpy(dtype=object)))
+        numbers = np.bitwise_or.reduce(octets << OCTETS_SHIFTS, axis=1)
+        result = Series(numbers, index=column.index, name=column.name)
+        return result.astype("UInt32").mask(~is_valid)
 
     def cast_value(self, value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
+        if self.as_uint32:
+            if not isinstance(value, str):
+                raise ValueError(f"Value {value} is not a string")
+            return int(Model(ip=value).ip)
         return str(value)
 
     def ignore_cast_for_types(self) -> Tuple[Any]:
+        if self.as_uint32:
+            return tuple()
         return (np.dtype("O"),)
+
+    @property
+    def nullable_dtype(self) -> Optional[Any]:
+        return "UInt32" if self.as_uint32 else None
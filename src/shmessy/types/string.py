@@ -2,7 +2,8 @@ import logging
 from typing import Any, Optional, Tuple
 
 from numpy import ndarray
-from pandas import Series
+from pandas import Series, StringDtype
+from pandas.api.types import infer_dtype
 
 from ..schema import InferredField
 from .base import BaseType
@@ -12,8 +13,23 @@ logger = logging.getLogger(__name__)
 
 class StringType(BaseType):
     weight = 9
+    # Object columns which astype(str) casts exactly like str() (it decodes bytes, for example)
+    VECTORIZED_INFERRED_DTYPES: Tuple[str, ...] = (
+        "string",
+        "empty",
+        "integer",
+        "floating",
+        "mixed-integer-float",
+        "boolean",
+    )
+
+    def __init__(self, string_storage: Optional[str] = None):
+        # "python" / "pyarrow" - Cast to the pandas string dtype instead of python objects
+        self.string_dtype = StringDtype(string_storage) if string_storage else None
 
     def validate(self, data: ndarray) -> Optional[InferredField]:
+        if data.dtype.kind in "biuf":
+            return InferredField(inferred_type=self.name)
         for value in data:
             try:
                 str(value)
@@ -22,11 +38,29 @@ class StringType(BaseType):
                 return None
         return InferredField(inferred_type=self.name)
 
+    def rejects(self, data: ndarray) -> bool:
+        # Every value is validated on its own
+        return self.validate(data) is None
+
+    def finish_validation(
+        self, values: ndarray, counts: ndarray, state: dict
+    ) -> Optional[InferredField]:
+        # Every value was validated on its own by the chunks
+        return InferredField(inferred_type=self.name)
+
     @property
     def prefer_column_casting(self) -> bool:
         return True
 
     def cast_column(self, column: Series, inferred_field: InferredField) -> Series:
+        if self.string_dtype:
+            # Nulls are kept as NA
+            return column.astype(self.string_dtype)
+        if column.dtype.kind in "biuf" or (
+            column.dtype.kind == "O"
+            and infer_dtype(column, skipna=True) in self.VECTORIZED_INFERRED_DTYPES
+        ):
+            return column.astype(str)
         return column.apply(lambda x: str(x))
 
     def cast_value(self, value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
@@ -1,13 +1,14 @@
 import logging
-from datetime import datetime, time
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 from numpy import ndarray
-from pandas import Series, to_datetime
+from pandas import Series, isna, to_datetime, to_numeric
 
-from ..schema import InferredField
+from ..schema import ColumnProfile, InferredField
 from .base import BaseType
 
 logger = logging.getLogger(__name__)
@@ -19,22 +20,36 @@ class TimestampResolution(str, Enum):
     NANOSECONDS = "ns"
 
 
+@lru_cache(maxsize=None)
+def _epoch_bounds(min_valid_year: int, max_valid_year: int) -> Tuple[float, float]:
+    # The seconds of [min_valid_year-01-01, max_valid_year+1-01-01)
+    start = datetime(min_valid_year, 1, 1, tzinfo=timezone.utc).timestamp()
+    end = datetime(max_valid_year + 1, 1, 1, tzinfo=timezone.utc).timestamp()
+    return start, end
+
+
 class UnixTimestampType(BaseType):
     weight = 4
     min_valid_year: int = 1980
     max_valid_year: int = 2100
-
-    resolution: Optional[TimestampResolution] = None
-
-    @staticmethod
-    def _unix_timestamp_resolution(value: int) -> TimestampResolution:
-        number_of_digits = len(str(int(value)))
-        if number_of_digits == 10:
-            return TimestampResolution.SECONDS
-        if number_of_digits == 13:
-            return TimestampResolution.MILLISECONDS
-        if number_of_digits == 16:
-            return TimestampResolution.NANOSECONDS
+    # The range of a 10 / 13 / 16 digits number
+    resolutions_magnitudes: Dict[TimestampResolution, Tuple[int, int]] = {
+        TimestampResolution.SECONDS: (10**9, 10**10),
+        TimestampResolution.MILLISECONDS: (10**12, 10**13),
+        TimestampResolution.NANOSECONDS: (10**15, 10**16),
+    }
+    # The to_datetime units, 16 digits are casted as microseconds (see _fix_input_resolution)
+    resolutions_units: Dict[TimestampResolution, str] = {
+        TimestampResolution.SECONDS: "s",
+        TimestampResolution.MILLISECONDS: "ms",
+        TimestampResolution.NANOSECONDS: "us",
+    }
+
+    @classmethod
+    def _unix_timestamp_resolution(cls, value: int) -> Optional[TimestampResolution]:
+        for resolution, (low, high) in cls.resolutions_magnitudes.items():
+            if low <= value < high:
+                return resolution
 
     @staticmethod
     def _fix_input_resolution(
@@ -47,48 +62,111 @@ class UnixTimestampType(BaseType):
         if selected_resolution == TimestampResolution.NANOSECONDS:
             return int(int(value) / 1000 / 1000)
 
-    def _is_valid_unix_timestamp(self, value: Any) -> bool:
-        if self.is_empty_value(value):
-            return True
-
-        if self.is_empty_value(value) or isinstance(value, (datetime, time)):
-            return False
-
-        if not self.resolution:
-            self.resolution = self._unix_timestamp_resolution(int(value))
+    def _to_numbers(self, data: ndarray) -> Optional[ndarray]:
+        """
+        int() of the non-empty values (as float64 for numeric arrays),
+        None in case one of them cannot be converted (datetime values included).
+        """
+        if data.dtype.kind in "iu":
+            return data
+        if data.dtype.kind == "f":
+            data = data[~np.isnan(data)]
+            return data if np.isfinite(data).all() else None
+
+        data = np.asarray(data, dtype=object)
+        nulls = np.asarray(isna(data), dtype=bool)
+        if not all(self.is_empty_value(value) for value in data[nulls]):
+            return None  # NaT / NA
+        try:
+            # numpy calls int() on each value
+            return data[~nulls].astype(np.int64)
+        except (ValueError, TypeError, OverflowError) as e:
+            logger.debug(f"Cannot cast the given data to {self.name}: {e}")
+            return None
 
-        if self.resolution:
-            parsed_value = datetime.utcfromtimestamp(
-                self._fix_input_resolution(value, self.resolution)
-            )
-            if self.min_valid_year <= parsed_value.year <= self.max_valid_year:
-                return True
-        return False
+    def _to_seconds(
+        self, numbers: ndarray, selected_resolution: TimestampResolution
+    ) -> ndarray:
+        # Same as _fix_input_resolution, for numeric arrays
+        seconds = np.trunc(numbers.astype(np.float64))
+        if selected_resolution == TimestampResolution.MILLISECONDS:
+            return np.trunc(seconds / 1000)
+        if selected_resolution == TimestampResolution.NANOSECONDS:
+            return np.trunc(seconds / 1000 / 1000)
+        return seconds
+
+    def _in_valid_years(self, seconds: ndarray) -> ndarray:
+        start, end = _epoch_bounds(self.min_valid_year, self.max_valid_year)
+        return (seconds >= start) & (seconds < end)
+
+    def is_ruled_out(self, profile: ColumnProfile) -> bool:
+        # int() fails for any string with letters
+        return "alpha" in profile.char_classes
+
+    def rejects(self, data: ndarray) -> bool:
+        # The resolution is selected by the first value, any other value
+        # is valid as long as it fits one of the resolutions
+        numbers = self._to_numbers(data)
+        if numbers is None:
+            return True
+        is_valid = np.zeros(len(numbers), dtype=bool)
+        for resolution in TimestampResolution:
+            is_valid |= self._in_valid_years(self._to_seconds(numbers, resolution))
+        return not is_valid.all()
 
     def validate(self, data: ndarray) -> Optional[InferredField]:
-        self.resolution = None
-        try:
-            for value in data:
-                if not self._is_valid_unix_timestamp(value):
-                    return None
+        numbers = self._to_numbers(data)
+        if numbers is None or not len(numbers):
+            return None
+        # Selected by the first non-empty value
+        resolution = self._unix_timestamp_resolution(int(numbers[0]))
+        if not resolution:
+            return None
+        if not self._in_valid_years(self._to_seconds(numbers, resolution)).all():
+            return None
+        return InferredField(inferred_type=self.name, inferred_pattern=resolution)
 
-            if not self.resolution:
-                return None
+    def validate_chunk(self, chunk: ndarray, state: dict) -> bool:
+        numbers = self._to_numbers(chunk)
+        if numbers is None:
+            return False
+        if not len(numbers):
+            return True
+        if "resolution" not in state:
+            # Selected by the first non-empty value of the sample
+            state["resolution"] = self._unix_timestamp_resolution(int(numbers[0]))
+        resolution = state["resolution"]
+        if not resolution:
+            return False
+        return bool(self._in_valid_years(self._to_seconds(numbers, resolution)).all())
 
+    def finish_validation(
+        self, values: ndarray, counts: ndarray, state: dict
+    ) -> Optional[InferredField]:
+        if state.get("resolution"):
             return InferredField(
-                inferred_type=self.name, inferred_pattern=self.resolution
+                inferred_type=self.name, inferred_pattern=state["resolution"]
             )
 
-        except (ValueError, OSError, OverflowError) as e:
-            logger.debug(f"Cannot cast the given data to {self.name}: {e}")
-            return None
-
     @property
     def prefer_column_casting(self) -> bool:
         return True
 
     def cast_column(self, column: Series, inferred_field: InferredField) -> Series:
-        return to_datetime(column, unit=inferred_field.inferred_pattern.value)
+        # Strings are converted to numbers first, to_datetime with a unit deprecates them
+        return to_datetime(
+            to_numeric(column),
+            unit=self.resolutions_units[inferred_field.inferred_pattern],
+        )
+
+    def cast_column_coerce(
+        self, column: Series, inferred_field: InferredField
+    ) -> Series:
+        return to_datetime(
+            to_numeric(column, errors="coerce"),
+            unit=self.resolutions_units[inferred_field.inferred_pattern],
+            errors="coerce",
+        )
 
     def cast_value(self, value: Any, pattern: Optional[Any] = None) -> Optional[Any]:
         if self.is_empty_value(value):
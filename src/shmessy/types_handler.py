@@ -1,6 +1,8 @@
 import logging
+import time
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
+import numpy as np
 from numpy import nan, ndarray
 from numpy.dtypes import (
     BoolDType,
@@ -16,11 +18,14 @@ from numpy.dtypes import (
     ObjectDType,
     StrDType,
 )
-from pandas import Series
+from pandas import Series, factorize, isna
 
 from shmessy.exceptions import FieldCastingException
 
-from .schema import Field, InferredField
+from .column_profile import build_column_profile
+from .numeric_utils import DEFAULT_NUMERIC_FORMAT, NumericFormat, get_numeric_format
+from .scheduler import TypesScheduler
+from .schema import BadValuesReport, Field, InferredField
 from .types.base import BaseType
 from .types.boolean import BooleanType
 from .types.date import DateType
@@ -38,10 +43,33 @@ logger = logging.getLogger(__name__)
 class TypesHandler:
     PACKAGE_NAME: str = "shmessy"
     TYPES_DIR: str = "types"
+    SINGLE_PASS_FIRST_CHUNK_SIZE: int = 64
+    BAD_VALUES_SAMPLE_SIZE: int = 10
 
-    def __init__(self, types_to_ignore: List[str]):
-        self.__types = self._discover_types(types_to_ignore=types_to_ignore)
+    def __init__(
+        self,
+        types_to_ignore: List[str],
+        single_pass: bool = False,
+        scheduler: Optional[TypesScheduler] = None,
+        locale_formatter: str = "en_US",
+        ipv4_as_uint32: bool = False,
+        string_storage: Optional[str] = None,
+    ):
+        self.__types = self._discover_types(
+            types_to_ignore=types_to_ignore,
+            numeric_format=get_numeric_format(locale_formatter),
+            ipv4_as_uint32=ipv4_as_uint32,
+            string_storage=string_storage,
+        )
+        # Used for fallback_to_string, even if the String type is ignored
+        self.__string_type = StringType(string_storage=string_storage)
         self.__types_as_dict: Dict[str, BaseType] = self._types_as_dict(self.__types)
+        self.__single_pass = single_pass
+        self.__scheduler = scheduler
+
+    @property
+    def scheduler(self) -> Optional[TypesScheduler]:
+        return self.__scheduler
 
     @classmethod
     def _types_as_dict(cls, __types: List[BaseType]) -> Dict[str, BaseType]:
@@ -51,7 +79,13 @@ class TypesHandler:
         return res
 
     @classmethod
-    def _discover_types(cls, types_to_ignore: List[str]) -> List[BaseType]:
+    def _discover_types(
+        cls,
+        types_to_ignore: List[str],
+        numeric_format: NumericFormat = DEFAULT_NUMERIC_FORMAT,
+        ipv4_as_uint32: bool = False,
+        string_storage: Optional[str] = None,
+    ) -> List[BaseType]:
         filtered_types = []
         types_to_ignore = (
             [x.lower() for x in types_to_ignore] if types_to_ignore else []
@@ -60,11 +94,11 @@ class TypesHandler:
             BooleanType(),
             DatetimeType(),
             DateType(),
-            FloatType(),
-            IntegerType(),
-            StringType(),
+            FloatType(numeric_format=numeric_format),
+            IntegerType(numeric_format=numeric_format),
+            StringType(string_storage=string_storage),
             UnixTimestampType(),
-            IPv4Type(),
+            IPv4Type(as_uint32=ipv4_as_uint32),
             EmailType(),
         ]
 
@@ -75,15 +109,84 @@ class TypesHandler:
         return sorted(filtered_types, key=lambda x: x.weight)
 
     @staticmethod
-    def _extract_bad_value(column: Series, func: Callable) -> Tuple[int, Any]:
-        for idx, row in enumerate(column):
+    def _rejected_values(
+        column: Series,
+        coerced: Series,
+        inferred_field: InferredField,
+        type_: BaseType,
+    ) -> Optional[ndarray]:
+        """
+        Mask of the values which became null while they were not null in the input, and
+        cast_value rejects as well (checked once per distinct value) - A coerced null may
+        also be a value which legitimately casts to null (a "nan" string for example).
+        None if a nulled value is accepted by cast_value and not casted to null.
+        """
+        is_nulled = coerced.isna().to_numpy() & column.notna().to_numpy()
+        if not is_nulled.any():
+            return is_nulled
+
+        def rejected(value: Any) -> Optional[bool]:
             try:
-                func(row)  # noqa
+                casted = type_.cast_value(value, inferred_field.inferred_pattern)
             except Exception:  # noqa
-                return idx + 2, row
+                return True
+            return False if isna(casted) else None
 
-        # If we reached this piece of code - The dtype is probably an object - do nothing!
-        raise NotImplementedError()
+        rejections = _cast_distinct_values(column[is_nulled], rejected)
+        if rejections.isna().any():
+            return None
+        is_nulled[is_nulled] = rejections.to_numpy(dtype=bool)
+        return is_nulled
+
+    def _coerced_bad_values(
+        self, column: Series, inferred_field: InferredField, type_: BaseType
+    ) -> Optional[ndarray]:
+        """
+        Locates the values which cannot be casted by a vectorized coerce cast.
+        None if the type has no such cast, or if it did not reject any value.
+        """
+        try:
+            coerced = type_.cast_column_coerce(column, inferred_field)
+        except Exception as e:  # noqa
+            logger.debug(f"Cannot coerce column to type: {type_}. Error: {e}")
+            return None
+        is_bad = self._rejected_values(column, coerced, inferred_field, type_)
+        return is_bad if is_bad is not None and is_bad.any() else None
+
+    def _bad_values_report(
+        self,
+        column: Series,
+        inferred_field: InferredField,
+        type_: BaseType,
+        row_offset: int = 0,
+        is_bad: Optional[ndarray] = None,
+    ) -> BadValuesReport:
+        if is_bad is None:
+            is_bad = self._coerced_bad_values(column, inferred_field, type_)
+        if is_bad is None:
+            # Types without a vectorized cast, or casts which failed on the nulls
+            is_bad = _locate_bad_values(
+                column=column,
+                func=lambda x: type_.cast_value(
+                    value=x, pattern=inferred_field.inferred_pattern
+                ),
+            )
+        positions = np.flatnonzero(is_bad)
+        if not len(positions):
+            # If we reached this piece of code - The dtype is probably an object - do nothing!
+            raise NotImplementedError()
+
+        sample_size = self.BAD_VALUES_SAMPLE_SIZE
+        sample = positions[:sample_size]
+        return BadValuesReport(
+            column_name=str(column.name),
+            inferred_type=type_.name,
+            inferred_pattern=inferred_field.inferred_pattern,
+            bad_values_count=len(positions),
+            # The header is the first line
+            line_numbers=(sample + row_offset + 2).tolist(),
+            bad_values=column.iloc[sample].tolist(),
+        )
 
     @staticmethod
     def _cast_with_fallback_to_null(
@@ -100,8 +203,9 @@ class TypesHandler:
         column: Series,
         inferred_field: InferredField,
         type_: BaseType,
-        fallback_to_null: Optional[bool] = False,
+        row_offset: int = 0,
     ) -> Series:
+        is_bad = None
         try:
             if column.dtype.type in type_.ignore_cast_for_types():
                 return column
@@ -110,48 +214,82 @@ class TypesHandler:
                     return type_.cast_column(column, inferred_field)
                 except Exception as e:  # noqa
                     logger.debug(f"Cannot cast column to type: {type_}. Error: {e}")
+                # Locate the bad values without casting the values one by one
+                is_bad = self._coerced_bad_values(column, inferred_field, type_)
 
-                    if fallback_to_null:
-                        logger.debug(
-                            f"Trying to cast column to type: {type_} using FallbackToNull"
-                        )
-                        return column.apply(
-                            lambda x: self._cast_with_fallback_to_null(
-                                x, inferred_field.inferred_pattern, type_
-                            )
-                        )
-
-            if fallback_to_null:
-                logger.debug(
-                    f"Trying to cast column to type: {type_} using FallbackToNull"
+            if is_bad is None:
+                return _cast_distinct_values(
+                    column,
+                    lambda x: type_.cast_value(x, inferred_field.inferred_pattern),
                 )
-                return column.apply(
-                    lambda x: self._cast_with_fallback_to_null(
-                        x, inferred_field.inferred_pattern, type_
-                    )
-                )
-
-            return column.apply(
-                lambda x: type_.cast_value(x, inferred_field.inferred_pattern)
-            )
         except Exception as e:
             logger.debug(f"Couldn't cast column to type {type_.name}: {e}")
+
+        try:
+            report = self._bad_values_report(
+                column, inferred_field, type_, row_offset, is_bad
+            )
+            raise FieldCastingException(
+                type_=type_.name,
+                line_number=report.line_numbers[0],
+                bad_value=report.bad_values[0],
+                column_name=str(column.name),
+                pattern=inferred_field.inferred_pattern,
+                report=report,
+            )
+        except NotImplementedError:
+            pass
+
+    def _coerce_column(
+        self, column: Series, inferred_field: InferredField, type_: BaseType
+    ) -> Tuple[Series, int]:
+        """
+        Casts the column while values which cannot be casted become nulls.
+        Returns the casted column and the number of nulled values.
+        """
+        if column.dtype.type in type_.ignore_cast_for_types():
+            return column, 0
+        logger.debug(f"Trying to cast column to type: {type_} using FallbackToNull")
+        try:
+            fixed_column = type_.cast_column_coerce(column, inferred_field)
+            is_bad = self._rejected_values(column, fixed_column, inferred_field, type_)
+        except NotImplementedError:
+            is_bad = None
+        if is_bad is None:
+            # No vectorized cast, or it nulled values which cast_value accepts
+            fixed_column = _cast_distinct_values(
+                column,
+                lambda x: self._cast_with_fallback_to_null(
+                    x, inferred_field.inferred_pattern, type_
+                ),
+            )
+            is_bad = self._rejected_values(column, fixed_column, inferred_field, type_)
+        return fixed_column, int(is_bad.sum())
+
+    def _fix_column_or_null(
+        self, column: Series, inferred_field: Field, type_: BaseType
+    ) -> Series:
+        """
+        Same as _fix_column with fallback to null: once the column cast fails, the column
+        is coerced right away, without locating the bad values.
+        """
+        if column.dtype.type in type_.ignore_cast_for_types():
+            return column
+        if type_.prefer_column_casting:
             try:
-                line_number, bad_value = self._extract_bad_value(
-                    column=column,
-                    func=lambda x: type_.cast_value(
-                        value=x, pattern=inferred_field.inferred_pattern
-                    ),
-                )
-                raise FieldCastingException(
-                    type_=type_.name,
-                    line_number=line_number,
-                    bad_value=bad_value,
-                    column_name=str(column.name),
-                    pattern=inferred_field.inferred_pattern,
-                )
-            except NotImplementedError:
-                pass
+                return type_.cast_column(column, inferred_field)
+            except Exception as e:  # noqa
+                logger.debug(f"Cannot cast column to type: {type_}. Error: {e}")
+
+        fixed_column, nulled_values_count = self._coerce_column(
+            column=column, inferred_field=inferred_field, type_=type_
+        )
+        if nulled_values_count:
+            logger.debug(
+                f"Casted {nulled_values_count} values of column {column.name} to null"
+            )
+            inferred_field.nulled_values_count = nulled_values_count
+        return fixed_column
 
     def fix_field(
         self,
@@ -159,49 +297,296 @@ class TypesHandler:
         inferred_field: Field,
         fallback_to_string: bool,
         fallback_to_null: bool,
+        row_offset: int = 0,
     ) -> Any:
+        """
+        row_offset is the position of the column's first row in the whole table
+        (when casting a partition of the rows), for the line numbers of the errors.
+        """
+        type_ = self.__types_as_dict[inferred_field.inferred_type]
+        if fallback_to_null and not fallback_to_string:
+            return self._fix_column_or_null(column, inferred_field, type_)
+
         try:
             return self._fix_column(
                 column=column,
                 inferred_field=inferred_field,
-                type_=self.__types_as_dict[inferred_field.inferred_type],
+                type_=type_,
+                row_offset=row_offset,
             )
 
         except FieldCastingException as e:
             logger.debug(e)
 
             if fallback_to_string:
-                logger.debug("Could not cast the field - Apply fallback to string")
-                return self._fix_column(
-                    column=column, inferred_field=inferred_field, type_=StringType()
-                )
+                return self.fix_field_as_string(column, inferred_field)
+            raise e
+
+    def fix_field_as_string(self, column: Series, inferred_field: Field) -> Series:
+        logger.debug("Could not cast the field - Apply fallback to string")
+        return self._fix_column(
+            column=column,
+            inferred_field=inferred_field,
+            type_=self.__string_type,
+        )
+
+    def is_cast_needed(self, column: Series, inferred_field: Field) -> bool:
+        type_ = self.__types_as_dict[inferred_field.inferred_type]
+        return column.dtype.type not in type_.ignore_cast_for_types()
 
-            if fallback_to_null:
-                return self._fix_column(
-                    column=column,
-                    inferred_field=inferred_field,
-                    type_=self.__types_as_dict[inferred_field.inferred_type],
-                    fallback_to_null=True,
+    def to_nullable_dtype(self, column: Series, inferred_field: Field) -> Series:
+        """
+        Casts a fixed column to the nullable dtype of its type, so columns with and
+        without nulls get the same dtype. Columns which fell back to string are kept.
+        """
+        type_ = self.__types_as_dict.get(inferred_field.inferred_type)
+        dtype = type_.nullable_dtype if type_ else None
+        if dtype is None or column.dtype == dtype:
+            return column
+        try:
+            return column.astype(dtype)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Column {column.name} is kept as {column.dtype}: {e}")
+            return column
+
+    def read_csv_date_formats(self, fields: List[Field]) -> Dict[Any, str]:
+        """
+        The fields which pd.read_csv can parse while reading, mapped to their date_format.
+        """
+        date_formats = {}
+        for field in fields:
+            type_ = self.__types_as_dict.get(field.inferred_type)
+            date_format = type_.read_csv_date_format(field) if type_ else None
+            if date_format:
+                date_formats[field.field_name] = date_format
+        return date_formats
+
+    def find_bad_values(
+        self, column: Series, inferred_field: Field
+    ) -> Optional[BadValuesReport]:
+        """
+        Returns the report of the values which cannot be casted to the inferred type,
+        None if the column can be fixed.
+        """
+        type_ = self.__types_as_dict.get(inferred_field.inferred_type)
+        if not type_:
+            return None
+        try:
+            self._fix_column(column=column, inferred_field=inferred_field, type_=type_)
+        except FieldCastingException as e:
+            return e.report
+
+    def _validate_single_pass(
+        self,
+        field_name: str,
+        values: ndarray,
+        counts: ndarray,
+        candidates: List[BaseType],
+    ) -> Optional[InferredField]:
+        """
+        Walk the values once (in growing chunks) - Each candidate validates the chunks
+        and keeps its state, the rejected ones are dropped. Once a single candidate
+        (other than String) is left, the rest of the values are validated at once,
+        and the winner is the lowest weight candidate which validated all of them.
+        """
+        states = [(type_, type_.start_validation()) for type_ in candidates]
+        start, chunk_size = 0, self.SINGLE_PASS_FIRST_CHUNK_SIZE
+        while start < len(values) and _count_specific_types(states) > 1:
+            end = start + chunk_size
+            chunk = values[start:end]
+            states = [
+                (type_, state)
+                for type_, state in states
+                if type_.validate_chunk(chunk, state)
+            ]
+            start, chunk_size = end, chunk_size * 2
+
+        logger.debug(
+            f"Candidate types for column {field_name}: {[x.name for x, _ in states]}"
+        )
+        rest = values[start:]
+        for type_, state in states:
+            if len(rest) and not type_.validate_chunk(rest, state):
+                continue
+            inferred = type_.finish_validation(values, counts, state)
+            if inferred:
+                return inferred
+
+    def _validate_scheduled(
+        self,
+        field_name: str,
+        values: ndarray,
+        counts: ndarray,
+        candidates: List[BaseType],
+    ) -> Optional[InferredField]:
+        """
+        Runs the cheap rejection checks picked by the scheduler, then validates
+        the surviving types by weight.
+        """
+        rejected = []
+        for type_ in self.__scheduler.order(candidates):
+            start_time = time.perf_counter()
+            if type_.rejects(values):
+                rejected.append((type_, time.perf_counter() - start_time))
+            else:
+                self.__scheduler.record_check(
+                    type_name=type_.name,
+                    seconds=time.perf_counter() - start_time,
+                    useful=False,
                 )
-            raise e
 
-    def infer_field(self, field_name: str, data: ndarray) -> Field:
-        for type_ in self.__types:
+        inferred, matched_weight = None, None
+        for type_ in candidates:
+            if any(type_ is x for x, _ in rejected):
+                continue
             logger.debug(f"Trying to match column {field_name} to type {type_.name}")
-            inferred = type_.validate(data)
+            start_time = time.perf_counter()
+            inferred = type_.validate_distinct(values, counts)
+            self.__scheduler.record_validation(
+                type_name=type_.name, seconds=time.perf_counter() - start_time
+            )
             if inferred:
-                return Field(
-                    field_name=field_name,
-                    source_type=_numpy_type_shmessy_type(data.dtype),
-                    inferred_type=inferred.inferred_type,
-                    inferred_pattern=inferred.inferred_pattern,
-                )
+                matched_weight = type_.weight
+                break
+
+        for type_, seconds in rejected:
+            # Useful only if the weight cascade would have validated the type
+            self.__scheduler.record_check(
+                type_name=type_.name,
+                seconds=seconds,
+                useful=matched_weight is None or type_.weight < matched_weight,
+            )
+        return inferred
+
+    def _validate_by_weight(
+        self,
+        field_name: str,
+        values: ndarray,
+        counts: ndarray,
+        candidates: List[BaseType],
+    ) -> Optional[InferredField]:
+        for type_ in candidates:
+            logger.debug(f"Trying to match column {field_name} to type {type_.name}")
+            inferred = type_.validate_distinct(values, counts)
+            if inferred:
+                return inferred
+
+    def infer_field(self, field_name: str, data: ndarray) -> Field:
+        if isinstance(data, Series):
+            data = data.values
+        if data.dtype.kind in "biuf":
+            # The types validate numeric arrays vectorized, no need to deduplicate
+            values, counts = data, np.ones(len(data), dtype=np.intp)
+        else:
+            values, counts = _distinct_values(data)
+        candidates = self.__types
+        profile = build_column_profile(values, counts)
+        if profile:
+            candidates = [x for x in candidates if not x.is_ruled_out(profile)]
+            profile.skipped_types = [
+                x.name for x in self.__types if x not in candidates
+            ]
+            logger.debug(
+                f"Skipped types for column {field_name}: {profile.skipped_types}"
+            )
 
+        if self.__single_pass:
+            validate = self._validate_single_pass
+        elif self.__scheduler:
+            validate = self._validate_scheduled
+        else:
+            validate = self._validate_by_weight
+        inferred = validate(field_name, values, counts, candidates)
         return Field(
-            field_name=field_name, source_type=_numpy_type_shmessy_type(data.dtype)
+            field_name=field_name,
+            source_type=_numpy_type_shmessy_type(data.dtype),
+            inferred_type=inferred.inferred_type if inferred else None,
+            inferred_pattern=inferred.inferred_pattern if inferred else None,
+            profile=profile,
         )
 
 
+def _count_specific_types(states: List[Tuple[BaseType, dict]]) -> int:
+    # String matches almost any sample, it is validated only if the others fail
+    return sum(not isinstance(type_, StringType) for type_, _ in states)
+
+
+def _cast_distinct_values(column: Series, func: Callable[[Any], Any]) -> Series:
+    """
+    Same as column.apply(func), but func is called once per distinct value and
+    the result is rebuilt using the factorized codes.
+    """
+    try:
+        codes, uniques = factorize(column, use_na_sentinel=True)
+    except TypeError as e:  # Unhashable values
+        logger.debug(f"Cannot factorize column {column.name}: {e}")
+        return column.apply(func)
+
+    casted_values = np.empty(len(uniques) + 1, dtype=object)
+    for idx, value in enumerate(uniques):
+        casted_values[idx] = func(value)
+    # Nulls (code -1) point to the last cell, they are handled right after
+    result = casted_values.take(codes)
+
+    casted_nulls: Dict[Type, Any] = {}
+    values = column.values
+    for idx in np.flatnonzero(codes < 0):
+        null_type = type(values[idx])
+        if null_type not in casted_nulls:
+            casted_nulls[null_type] = func(values[idx])
+        result[idx] = casted_nulls[null_type]
+
+    return Series(result, index=column.index, name=column.name).infer_objects()
+
+
+def _locate_bad_values(column: Series, func: Callable[[Any], Any]) -> ndarray:
+    """
+    Mask of the values func fails on, func is called once per distinct value.
+    """
+
+    def fails(value: Any) -> bool:
+        try:
+            func(value)
+            return False
+        except Exception:  # noqa
+            return True
+
+    return _cast_distinct_values(column, fails).to_numpy(dtype=bool)
+
+
+def _distinct_values(data: ndarray) -> Tuple[ndarray, ndarray]:
+    """
+    Returns the distinct values of the data (by order of appearance) and the number
+    of occurrences of each one. Nulls are kept once per null type (None / NaN / NaT)
+    since the types treat them differently.
+    """
+    try:
+        codes, _ = factorize(data, use_na_sentinel=True)
+    except TypeError as e:  # Unhashable values
+        logger.debug(f"Cannot extract the distinct values: {e}")
+        return data, np.ones(len(data), dtype=np.int64)
+
+    unique_codes, first_indices, counts = np.unique(
+        codes, return_index=True, return_counts=True
+    )
+    not_null = unique_codes >= 0
+    first_indices, counts = list(first_indices[not_null]), list(counts[not_null])
+
+    null_indices = np.flatnonzero(isna(data)) if not not_null.all() else []
+    null_types: Dict[Type, int] = {}
+    for idx in null_indices:
+        null_type = type(data[idx])
+        if null_type not in null_types:
+            null_types[null_type] = len(first_indices)
+            first_indices.append(idx)
+            counts.append(0)
+        counts[null_types[null_type]] += 1
+
+    first_indices = np.array(first_indices, dtype=np.intp)
+    order = np.argsort(first_indices, kind="stable")
+    return data[first_indices[order]], np.array(counts, dtype=np.int64)[order]
+
+
 def _numpy_type_shmessy_type(numpy_type: Type) -> str:
     if isinstance(
         numpy_type,
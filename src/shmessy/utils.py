@@ -1,9 +1,9 @@
 import csv
 import logging
 import re
-from typing import Any, BinaryIO, Dict, Optional, TextIO, Union
+from typing import Any, BinaryIO, Dict, List, Optional, TextIO, Union
 
-from pandas import DataFrame
+from pandas import DataFrame, Index, Series
 
 from .exceptions import TooManyColumnException
 from .schema import ShmessySchema
@@ -56,8 +56,13 @@ def _fix_column_names(df: DataFrame) -> Dict[str, str]:
     return fixed_column_names
 
 
-def _fix_column_names_in_df(input_df: DataFrame, mapping: Dict[str, str]) -> DataFrame:
-    return input_df.rename(columns=mapping)
+def _assemble_df(columns: List[Series], names: List[Any], index: Index) -> DataFrame:
+    """
+    Builds the dataframe at once, the columns are referenced and not copied.
+    """
+    df = DataFrame(dict(enumerate(columns)), index=index, copy=False)
+    df.columns = names  # Keeps duplicated names
+    return df
 
 
 def _fix_column_names_in_shmessy_schema(
@@ -1,6 +1,10 @@
+import pickle
+
+import pandas as pd
 import pytest
+
 from shmessy import Shmessy
-import pandas as pd
+from shmessy.exceptions import FieldCastingException
 
 
 def test_too_many_columns_exception():
@@ -15,4 +19,90 @@ def test_too_many_columns_exception():
     shmessy = Shmessy(max_columns_num=2)
     with pytest.raises(Exception) as e:
         shmessy.fix_schema(df)
-    assert "The input table contains 4 columns. The maximum number of columns we support is 2" in str(e)
\ No newline at end of file
+    assert "The input table contains 4 columns. The maximum number of columns we support is 2" in str(e)
+
+def test_casting_exception_reports_all_bad_values():
+    data = [x for x in range(1000)]
+    data[500], data[700], data[900] = "bad", "worse", "bad"
+    df = pd.DataFrame({"test_column": data})
+    shmessy = Shmessy(sample_size=10, use_random_sample=False)
+    with pytest.raises(FieldCastingException) as e:
+        shmessy.fix_schema(df)
+
+    assert "Found 3 bad values in this column" in str(e.value)
+    assert e.value.report.line_numbers == [502, 702, 902]
+    assert e.value.report.bad_values == ["bad", "worse", "bad"]
+
+    unpickled = pickle.loads(pickle.dumps(e.value))
+    assert str(unpickled) == str(e.value)
+    assert unpickled.report == e.value.report
+
+
+def test_find_bad_values():
+    df = pd.DataFrame({
+        "integers": ["1", "2", "3", "x", "5", "y"],
+        "strings": ["a", "b", "c", "d", "e", "f"],
+    })
+    reports = Shmessy(sample_size=3, use_random_sample=False).find_bad_values(df)
+
+    assert [(x.column_name, x.inferred_type, x.bad_values_count, x.line_numbers) for x in reports] == [
+        ("integers", "Integer", 2, [5, 7])
+    ]
+
+
+def test_parallel_casting_raises_first_column_exception():
+    data = [x for x in range(1000)]
+    df = pd.DataFrame({
+        "strings": ["a"] * 1000,
+        "first": data[:999] + ["bad"],
+        "second": ["worse"] + data[1:],
+    })
+    shmessy = Shmessy(sample_size=10, use_random_sample=False, cast_workers=4)
+    with pytest.raises(FieldCastingException) as e:
+        shmessy.fix_schema(df)
+
+    assert e.value.report.column_name == "first"
+
+
+def test_partitioned_casting_reports_line_numbers_of_all_partitions():
+    data = [x for x in range(1000)]
+    data[500], data[700], data[900] = "bad", "worse", "bad"
+    df = pd.DataFrame({"test_column": data})
+    shmessy = Shmessy(sample_size=10, use_random_sample=False, max_workers=2, partition_rows=300)
+    with pytest.raises(FieldCastingException) as e:
+        shmessy.fix_schema(df)
+
+    assert e.value.report.line_numbers == [502, 702, 902]
+    assert e.value.report.bad_values_count == 3
+
+
+def test_fallback_to_null_nulls_the_reported_bad_values():
+    df = pd.DataFrame({"test_column": ["1", "2", "3", "1.0", "1e3", "x", "1_000"]})
+    with pytest.raises(FieldCastingException) as e:
+        Shmessy(sample_size=3, use_random_sample=False).fix_schema(df.copy())
+
+    shmessy = Shmessy(sample_size=3, use_random_sample=False, fallback_to_null=True)
+    fixed_df = shmessy.fix_schema(df)
+    assert shmessy.get_inferred_schema().columns[0].nulled_values_count == e.value.report.bad_values_count == 3
+    assert fixed_df["test_column"].tolist()[-1] == 1000
+
+
+def test_nan_literal_is_not_a_bad_value():
+    df = pd.DataFrame({"test_column": ["1.5", "nan", "2.5", "abc"]})
+    with pytest.raises(FieldCastingException) as e:
+        Shmessy(sample_size=3, use_random_sample=False).fix_schema(df.copy())
+    assert e.value.report.bad_values == ["abc"]
+    assert e.value.report.line_numbers == [5]
+
+    shmessy = Shmessy(sample_size=3, use_random_sample=False, fallback_to_null=True)
+    shmessy.fix_schema(df)
+    assert shmessy.get_inferred_schema().columns[0].nulled_values_count == 1
+
+
+def test_underscore_separated_timestamp_is_not_a_bad_value():
+    df = pd.DataFrame({"test_column": ["1700000000", "1700000001", "1_700_000_000"]})
+    shmessy = Shmessy(sample_size=2, use_random_sample=False)
+    fixed_df = shmessy.fix_schema(df)
+
+    assert shmessy.get_inferred_schema().columns[0].inferred_type == "UnixTimestamp"
+    assert fixed_df["test_column"].iloc[2] == fixed_df["test_column"].iloc[0]
@@ -1,3 +1,6 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 from parametrization import Parametrization
 
@@ -70,3 +73,82 @@ def test_issue_input_columns_as_object(df_data, fix_column_names, expected_resul
     df = Shmessy(fix_column_names=fix_column_names).fix_schema(df)
     assert [column for column in df] == expected_result
 
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Keep column names", fix_column_names=False)
+@Parametrization.case(name="Fix column names", fix_column_names=True)
+def test_fix_schema_not_inplace(fix_column_names):
+    df = pd.DataFrame({
+        "score": [90, 40, 80, 98],
+        "date of birth": ["2000-01-01", "2001-02-03", "1999-12-31", "2002-05-06"],
+    })
+    original_df = df.copy()
+    fixed_df = Shmessy(fix_column_names=fix_column_names).fix_schema(df, inplace=False)
+
+    pd.testing.assert_frame_equal(df, original_df)
+    assert fixed_df.iloc[:, 1].dtype == "datetime64[ns]"
+    # Columns which are not casted are referenced, not copied
+    assert np.shares_memory(fixed_df.iloc[:, 0].values, df["score"].values)
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Fail on bad values", fallback_to_string=False, fallback_to_null=False)
+@Parametrization.case(name="Fallback to string", fallback_to_string=True, fallback_to_null=False)
+@Parametrization.case(name="Fallback to null", fallback_to_string=False, fallback_to_null=True)
+def test_parallel_casting_same_as_serial(fallback_to_string, fallback_to_null):
+    df = pd.DataFrame({
+        "integer": ["1", "2", "3", "x"],
+        "date": ["2000-01-01", "2001-02-03", "1999-12-31", "2002-05-06"],
+        "float": ["1.5", "2", "3.25", "4"],
+        "string": ["a", "b", "c", "d"],
+    })
+    if not fallback_to_string and not fallback_to_null:
+        df = df.iloc[:3]
+    options = dict(
+        sample_size=3,
+        use_random_sample=False,
+        fallback_to_string=fallback_to_string,
+        fallback_to_null=fallback_to_null,
+    )
+    expected = Shmessy(**options).fix_schema(df, inplace=False)
+    fixed_df = Shmessy(cast_workers=4, **options).fix_schema(df, inplace=False)
+
+    pd.testing.assert_frame_equal(fixed_df, expected)
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Fail on bad values", fallback_to_null=False, fallback_to_string=False)
+@Parametrization.case(name="Fallback to null", fallback_to_null=True, fallback_to_string=False)
+@Parametrization.case(name="Fallback to string first", fallback_to_null=True, fallback_to_string=True)
+def test_partitioned_casting_same_as_serial(fallback_to_null, fallback_to_string):
+    df = pd.DataFrame({
+        "unix": np.arange(1000) + 1706024027,
+        "integer": [str(x) for x in range(999)] + ["x" if fallback_to_null else "999"],
+        "date": ["2020-01-%02d" % (x % 28 + 1) for x in range(1000)],
+        "string": ["a", "b"] * 500,
+    }, index=np.arange(1000) * 3)
+    options = dict(
+        sample_size=10, use_random_sample=False, fallback_to_null=fallback_to_null, fallback_to_string=fallback_to_string
+    )
+    expected = Shmessy(**options).fix_schema(df, inplace=False)
+    shmessy = Shmessy(max_workers=2, partition_rows=300, **options)
+    fixed_df = shmessy.fix_schema(df, inplace=False)
+
+    pd.testing.assert_frame_equal(fixed_df, expected)
+    nulled_values_count = 1 if fallback_to_null and not fallback_to_string else None
+    assert shmessy.get_inferred_schema().columns[1].nulled_values_count == nulled_values_count
+
+
+def test_partitioned_casting_on_threads_counts_nulled_values_per_partition():
+    values = [str(x) for x in range(1000)]
+    values[500] = "x"
+    df = pd.DataFrame({"integer": values})
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        shmessy = Shmessy(
+            sample_size=10, use_random_sample=False, fallback_to_null=True, executor=executor, partition_rows=100
+        )
+        fixed_df = shmessy.fix_schema(df)
+
+    assert fixed_df["integer"].isna().sum() == 1
+    assert shmessy.get_inferred_schema().columns[0].nulled_values_count == 1
@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from shmessy import Shmessy
+
+
+def _wide_df() -> pd.DataFrame:
+    columns = {
+        "integer": ["1", "2", "3", "4"],
+        "float": ["1.5", "2", "3.25", "4"],
+        "boolean": ["yes", "no", "no", "yes"],
+        "date": ["2020-01-01", "2020-02-01", "2020-03-01", "2020-04-01"],
+        "ip": ["1.2.3.4", "10.0.0.1", "8.8.8.8", "127.0.0.1"],
+        "string": ["a", "b", "c", "d"],
+        "numbers": [1, 2, 3, 4],
+    }
+    return pd.DataFrame({f"{name}_{x}": data for x in range(5) for name, data in columns.items()})
+
+
+def test_process_pool_inference_same_as_serial():
+    df = _wide_df()
+    expected = Shmessy(use_random_sample=False).infer_schema(df).columns
+
+    assert Shmessy(use_random_sample=False, max_workers=2).infer_schema(df).columns == expected
+
+
+def test_executor_inference_same_as_serial():
+    df = _wide_df()
+    expected = Shmessy(use_random_sample=False).infer_schema(df).columns
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        shmessy = Shmessy(use_random_sample=False, executor=executor)
+        assert shmessy.infer_schema(df).columns == expected
+        assert [column.field_name for column in shmessy.infer_schema(df).columns] == list(df.columns)
@@ -1,6 +1,10 @@
 import numpy as np
+import pandas as pd
+import pytest
+from parametrization import Parametrization
 
 from shmessy import Shmessy
+from shmessy.exceptions import FieldCastingException
 
 
 def test_read_csv(files_folder):
@@ -70,3 +74,112 @@ def test_empty_column_should_identified_as_string(files_folder):
     assert df["col_2"].dtype == np.dtype("O")
     assert schema.columns[0].inferred_type == "String"
     assert schema.columns[1].inferred_type == "String"
+
+
+def test_read_csv_chunks_same_as_read_csv(files_folder):
+    path = files_folder.as_posix() + "/data_1.csv"
+    shmessy = Shmessy(use_random_sample=False)
+    expected = shmessy.read_csv(path)
+    chunks = list(shmessy.read_csv_chunks(path, chunksize=100))
+
+    assert len(chunks) > 1
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+
+def test_read_csv_chunks_locks_the_schema(tmp_files_folder):
+    path = (tmp_files_folder / "chunks.csv").as_posix()
+    values = [str(x) for x in range(300)]
+    values[150], values[250] = "bad", "worse"
+    pd.DataFrame({"value": values}).to_csv(path, index=False)
+
+    with pytest.raises(FieldCastingException) as e:
+        list(Shmessy(use_random_sample=False).read_csv_chunks(path, chunksize=100))
+    assert e.value.report.line_numbers == [152]
+
+    shmessy = Shmessy(use_random_sample=False, fallback_to_null=True)
+    chunks = list(shmessy.read_csv_chunks(path, chunksize=100))
+    assert [chunk["value"].dtype for chunk in chunks] == [pd.Int64Dtype()] * 3
+    assert shmessy.get_inferred_schema().columns[0].nulled_values_count == 2
+
+
+def test_read_csv_chunks_running_nulled_values_count(tmp_files_folder):
+    path = (tmp_files_folder / "chunks.csv").as_posix()
+    values = [str(x) for x in range(300)]
+    values[150], values[250] = "bad", "worse"
+    pd.DataFrame({"value": values}).to_csv(path, index=False)
+
+    shmessy = Shmessy(use_random_sample=False, fallback_to_null=True)
+    nulled_values_counts = [
+        shmessy.get_inferred_schema().columns[0].nulled_values_count
+        for _ in shmessy.read_csv_chunks(path, chunksize=100)
+    ]
+    assert nulled_values_counts == [None, 1, 2]
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Dates and timestamps", file_name="data_1.csv")
+@Parametrization.case(name="All the date formats", file_name="data_2.csv")
+@Parametrization.case(name="Semicolon as delimiter", file_name="data_4.csv")
+def test_typed_read_csv_same_as_read_csv(files_folder, file_name):
+    path = files_folder.as_posix() + "/" + file_name
+    expected_df, expected_schema = Shmessy(use_random_sample=False).infer_and_read_csv(path)
+    df, schema = Shmessy(use_random_sample=False, typed_read_csv=True).infer_and_read_csv(path)
+
+    pd.testing.assert_frame_equal(df, expected_df)
+    assert [(x.field_name, x.inferred_type, x.inferred_pattern) for x in schema.columns] == [
+        (x.field_name, x.inferred_type, x.inferred_pattern) for x in expected_schema.columns
+    ]
+
+
+def test_typed_read_csv_with_bad_date(tmp_files_folder):
+    path = (tmp_files_folder / "dates.csv").as_posix()
+    dates = ["2020-01-%02d" % (x % 28 + 1) for x in range(300)]
+    dates[200] = "2020-13-01"
+    pd.DataFrame({"date": dates}).to_csv(path, index=False)
+
+    with pytest.raises(FieldCastingException) as e:
+        Shmessy(sample_size=100, use_random_sample=False, typed_read_csv=True).read_csv(path)
+    assert e.value.report.line_numbers == [202]
+
+    shmessy = Shmessy(sample_size=100, use_random_sample=False, typed_read_csv=True, fallback_to_null=True)
+    df = shmessy.read_csv(path)
+    assert df["date"].dtype == np.dtype("datetime64[ns]")
+    assert df["date"].isna().sum() == 1
+
+
+def test_infer_csv_schema(files_folder):
+    path = files_folder.as_posix() + "/data_1.csv"
+    shmessy = Shmessy(use_random_sample=False)
+    expected = shmessy.infer_and_read_csv(path)[1]
+    schema = shmessy.infer_csv_schema(path)
+
+    assert [(x.field_name, x.inferred_type, x.inferred_pattern) for x in schema.columns] == [
+        (x.field_name, x.inferred_type, x.inferred_pattern) for x in expected.columns
+    ]
+    assert shmessy.get_inferred_schema() == schema
+
+
+def test_infer_csv_schema_reads_only_the_sample(tmp_files_folder):
+    path = (tmp_files_folder / "schema.csv").as_posix()
+    with open(path, mode="wt") as output_file:
+        output_file.write("id,value\n")
+        output_file.writelines(f"{x},v{x}\n" for x in range(100))
+        output_file.write("broken,line,with,too,many,fields\n")
+
+    schema = Shmessy(sample_size=50).infer_csv_schema(path)
+    assert [(x.field_name, x.inferred_type) for x in schema.columns] == [("id", "Integer"), ("value", "String")]
+
+
+def test_read_csv_chunks_with_fixed_column_names(tmp_files_folder):
+    path = (tmp_files_folder / "chunks.csv").as_posix()
+    flags = ["yes", "no"] * 150
+    flags[250] = "maybe"
+    pd.DataFrame({"is active": flags}).to_csv(path, index=False)
+
+    shmessy = Shmessy(use_random_sample=False, fix_column_names=True, fallback_to_null=True)
+    chunks = list(shmessy.read_csv_chunks(path, chunksize=100))
+
+    assert [list(chunk.columns) for chunk in chunks] == [["is_active"]] * 3
+    assert [chunk["is_active"].dtype for chunk in chunks] == [pd.BooleanDtype()] * 3
+    assert [x.field_name for x in shmessy.get_inferred_schema().columns] == ["is_active"]
+    assert shmessy.get_inferred_schema().columns[0].nulled_values_count == 1
@@ -0,0 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from shmessy import Shmessy
+
+
+def test_shared_instance_between_threads(files_folder):
+    shmessy = Shmessy(use_random_sample=False)
+    paths = [(files_folder / f"data_{x}.csv").as_posix() for x in range(1, 9)] * 4
+    expected = [shmessy.infer_and_read_csv(path)[1].columns for path in paths]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(shmessy.infer_and_read_csv, paths))
+
+    assert [schema.columns for _, schema in results] == expected
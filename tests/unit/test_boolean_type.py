@@ -134,3 +134,13 @@ def test_boolean_fallback_to_null_turn_on(df_data, expected_shmessy_type, expect
     assert result.columns[0].inferred_type == expected_shmessy_type
     assert fixed_df["test_column"].dtype.type == expected_numpy_type.type
     assert [x for x in df["test_column"]] == [x for x in expected_result]
+
+
+def test_boolean_column_with_nulls():
+    shmessy = Shmessy(use_random_sample=False, sample_size=2)
+    df = pd.DataFrame({"test_column": ["Yes", "no", None, "yes"]})
+    fixed_df = shmessy.fix_schema(df)
+
+    assert shmessy.get_inferred_schema().columns[0].inferred_type == "Boolean"
+    assert fixed_df["test_column"].dtype == pd.BooleanDtype()
+    assert fixed_df["test_column"].tolist() == [True, False, pd.NA, True]
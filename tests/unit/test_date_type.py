@@ -3,6 +3,7 @@ from datetime import datetime
 import numpy as np
 import pandas as pd
 from parametrization import Parametrization
+from shmessy.date_utils import prune_patterns
 from shmessy.types.date import DateType
 
 from shmessy import Shmessy
@@ -250,3 +251,44 @@ def test_include_date_static_patterns():
     for p in input_static_patterns:
         assert p in result_all_patterns
         assert p not in result_without_static_patterns
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(
+    name="Dates outside of pandas bounds",
+    data=["0001-01-01", "2022-01-05", None],
+    expected_pattern="%Y-%m-%d",
+)
+@Parametrization.case(
+    name="Pattern matches only the first value",
+    data=["2022-01-05", "2022-01-05 10:00"],
+    expected_pattern=None,
+)
+@Parametrization.case(
+    name="Non string value",
+    data=["2022-01-05", 12],
+    expected_pattern=None,
+)
+def test_date_validate(data, expected_pattern):
+    inferred = DateType().validate(np.array(data, dtype=object))
+    assert (inferred.inferred_pattern if inferred else None) == expected_pattern
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(
+    name="Day part is bigger than 12",
+    data=["12/21/2022", "03/11/2022"],
+    expected_patterns=["%m/%d/%Y"],
+)
+@Parametrization.case(
+    name="Month names",
+    data=["10 Apr 24, Wed", "11 May 24, Sat"],
+    expected_patterns=["%d %b %y, %a"],
+)
+@Parametrization.case(
+    name="Free text",
+    data=["hello world", "12/21/2022"],
+    expected_patterns=[],
+)
+def test_prune_patterns(data, expected_patterns):
+    assert prune_patterns(data, DateType.get_patterns()) == expected_patterns
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 from parametrization import Parametrization
 
-from shmessy import Shmessy
+from shmessy import Shmessy, TypesHandler
 
 
 @Parametrization.autodetect_parameters()
@@ -38,3 +38,13 @@ def test_source_column_already_defines_as_date():
     df = pd.DataFrame(pd.date_range(start='2020-11-03', end='2021-10-01'), columns=['test_column'])
     fixed_df = Shmessy().fix_schema(df)
     assert fixed_df["test_column"].dtype.type == np.dtype("datetime64")
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Leap second", data=["2020-01-05 10:00:59", "2020-01-05 10:00:60"], expected_type="String")
+@Parametrization.case(name="Seconds 0 and 1", data=["2020-01-05 10:00:59", "2020-01-05 10:01:00", "2020-01-05 10:01:01"], expected_type="Datetime")
+@Parametrization.case(name="Unknown timezone name", data=["2020-01-05 10:00:00 UTC", "2020-01-05 10:00:00 EST"], expected_type="String")
+def test_values_rejected_by_strptime(data, expected_type):
+    # pandas parses these values, the inference keeps the strptime semantics
+    field = TypesHandler(types_to_ignore=[]).infer_field("col", np.array(data, dtype=object))
+    assert field.inferred_type == expected_type
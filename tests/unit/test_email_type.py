@@ -3,6 +3,7 @@ import pandas as pd
 from parametrization import Parametrization
 
 from shmessy import Shmessy
+from shmessy.types.email import EmailType
 
 
 @Parametrization.autodetect_parameters()
@@ -40,4 +41,16 @@ def test_email_type_turn_off_email_types(df_data, expected_shmessy_type, expecte
     fixed_df = shmessy.fix_schema(df)
 
     assert inferred_schema.columns[0].inferred_type == expected_shmessy_type
-    assert fixed_df["test_column"].dtype.type == expected_numpy_type.type
\ No newline at end of file
+    assert fixed_df["test_column"].dtype.type == expected_numpy_type.type
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Emails", data=["ohad@gmail.com", " hello@microsoft.com "], expected_result=True)
+@Parametrization.case(name="Display name", data=["Ohad <ohad@gmail.com>", "world@nana.co.il"], expected_result=True)
+@Parametrization.case(name="Missing domain dot", data=["ohad@gmail.com", "hello@localhost"], expected_result=False)
+@Parametrization.case(name="Double at sign", data=["ohad@@gmail.com"], expected_result=False)
+@Parametrization.case(name="Nulls", data=["ohad@gmail.com", None], expected_result=False)
+@Parametrization.case(name="Numbers", data=[1, 2], expected_result=False)
+def test_email_validate(data, expected_result):
+    data = np.array(data, dtype=object)
+    assert (EmailType().validate(data) is not None) == expected_result
+    assert EmailType().rejects(data) != expected_result
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+from parametrization import Parametrization
+
+from shmessy import Shmessy
+from shmessy.types.ipv4_address import IPv4Type, format_ipv4
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Addresses", data=["1.2.3.4", "255.255.255.255", "0.0.0.0"], expected_result=True)
+@Parametrization.case(name="Out of range octet", data=["1.2.3.4", "256.1.1.1"], expected_result=False)
+@Parametrization.case(name="Leading zeros", data=["01.2.3.4"], expected_result=False)
+@Parametrization.case(name="Three octets", data=["1.2.3"], expected_result=False)
+@Parametrization.case(name="Surrounding spaces", data=["1.2.3.4 "], expected_result=False)
+@Parametrization.case(name="Nulls", data=["1.2.3.4", None], expected_result=False)
+def test_ipv4_validate(data, expected_result):
+    data = np.array(data, dtype=object)
+    assert (IPv4Type().validate(data) is not None) == expected_result
+
+
+def test_ipv4_as_uint32():
+    shmessy = Shmessy(ipv4_as_uint32=True, use_random_sample=False, sample_size=2)
+    df = pd.DataFrame({"test_column": ["1.2.3.4", "10.0.0.1", "255.255.255.255"]})
+    fixed_df = shmessy.fix_schema(df)
+
+    assert shmessy.get_inferred_schema().columns[0].inferred_type == "IPv4"
+    assert fixed_df["test_column"].dtype == np.dtype("uint32")
+    assert fixed_df["test_column"].tolist() == [16909060, 167772161, 4294967295]
+    assert format_ipv4(fixed_df["test_column"]).tolist() == ["1.2.3.4", "10.0.0.1", "255.255.255.255"]
+
+
+def test_ipv4_as_uint32_with_nulls():
+    shmessy = Shmessy(ipv4_as_uint32=True, use_random_sample=False, sample_size=2)
+    df = pd.DataFrame({"test_column": ["1.2.3.4", "10.0.0.1", None]})
+    fixed_df = shmessy.fix_schema(df)
+
+    assert fixed_df["test_column"].dtype == pd.UInt32Dtype()
+    assert format_ipv4(fixed_df["test_column"]).tolist() == ["1.2.3.4", "10.0.0.1", None]
@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from parametrization import Parametrization
+
+from shmessy.numeric_utils import (
+    DEFAULT_NUMERIC_FORMAT,
+    coerce_numbers,
+    get_numeric_format,
+    out_of_bounds,
+    parse_value,
+    to_numbers,
+)
+from shmessy.types.float import FloatType
+from shmessy.types.integer import IntegerType
+
+
+def test_to_numbers_with_separators():
+    values = np.array(["15,322", "1,230", 1, " 7 "], dtype=object)
+    assert to_numbers(values, DEFAULT_NUMERIC_FORMAT, integer=True).tolist() == [15322, 1230, 1, 7]
+
+    german_format = get_numeric_format("de_DE")
+    values = np.array(["15.322,5", "1,5"], dtype=object)
+    assert to_numbers(values, german_format, integer=False).tolist() == [15322.5, 1.5]
+
+
+def test_to_numbers_raises_on_bad_value():
+    with pytest.raises(ValueError):
+        to_numbers(np.array(["1", "1.5"], dtype=object), DEFAULT_NUMERIC_FORMAT, integer=True)
+    with pytest.raises(TypeError):
+        to_numbers(np.array(["1", None], dtype=object), DEFAULT_NUMERIC_FORMAT, integer=False)
+
+
+def test_out_of_bounds():
+    values = np.array(["9,223,372,036,854,775,808", "1", "-9223372036854775808"], dtype=object)
+    numbers = to_numbers(values, DEFAULT_NUMERIC_FORMAT, integer=True)
+    assert out_of_bounds(numbers, IntegerType.MIN_BOUNDARY, IntegerType.MAX_BOUNDARY).tolist() == [True, False, True]
+    assert IntegerType().validate(values) is None
+
+
+def test_types_use_the_numeric_format():
+    german_format = get_numeric_format("de_DE")
+    assert IntegerType(numeric_format=german_format).validate(np.array(["1.234", "5"], dtype=object))
+    assert FloatType(numeric_format=german_format).cast_value("1.234,5") == 1234.5
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Integers", integer=True)
+@Parametrization.case(name="Floats", integer=False)
+def test_coerce_numbers_same_as_parse_value(integer):
+    values = np.array(
+        ["1", "1.0", "1e3", "1_000", "1__0", " 12 ", "+5", "1,234", ".5", "inf", "nan", "x", "", "٣", 7, 2.5, True],
+        dtype=object,
+    )
+    numbers, is_valid = coerce_numbers(values, DEFAULT_NUMERIC_FORMAT, integer=integer)
+
+    for value, number, valid in zip(values, numbers, is_valid):
+        try:
+            expected = parse_value(value, DEFAULT_NUMERIC_FORMAT, integer=integer)
+        except ValueError:
+            assert not valid, value
+            continue
+        assert valid, value
+        assert number == expected or (np.isnan(number) and np.isnan(expected)), value
@@ -0,0 +1,40 @@
+import numpy as np
+
+from shmessy.pattern_registry import PatternRegistry, pattern_registry
+from shmessy.types.date import DateType
+
+
+def test_patterns_ordered_by_hits_inside_group():
+    registry = PatternRegistry()
+    groups = [["%m/%d/%Y", "%m-%d-%Y"], ["%d/%m/%Y", "%d-%m-%Y"]]
+    assert registry.get_patterns("Date", lambda: groups) == [
+        "%m/%d/%Y", "%m-%d-%Y", "%d/%m/%Y", "%d-%m-%Y"
+    ]
+
+    registry.record_hit("Date", "%d-%m-%Y")
+    registry.record_hit("Date", "%m-%d-%Y")
+    registry.record_hit("Date", "%d-%m-%Y")
+
+    # Ambiguous patterns (different groups) keep their precedence
+    assert registry.get_patterns("Date", lambda: groups) == [
+        "%m-%d-%Y", "%m/%d/%Y", "%d-%m-%Y", "%d/%m/%Y"
+    ]
+
+
+def test_hit_counts_persistence(tmp_files_folder):
+    registry = PatternRegistry()
+    registry.record_hit("Date", "%Y-%m-%d")
+    registry.record_hit("Date", "%Y-%m-%d")
+    registry.save((tmp_files_folder / "hits.json").as_posix())
+
+    loaded_registry = PatternRegistry()
+    loaded_registry.load((tmp_files_folder / "hits.json").as_posix())
+    assert loaded_registry.get_hit_counts() == {"Date": {"%Y-%m-%d": 2}}
+
+
+def test_date_type_records_hits():
+    hits_before = pattern_registry.get_hit_counts().get("Date", {}).get("%Y-%m-%d", 0)
+    inferred = DateType().validate(np.array(["2020-04-11", "2021-05-23"], dtype=object))
+
+    assert inferred.inferred_pattern == "%Y-%m-%d"
+    assert pattern_registry.get_hit_counts()["Date"]["%Y-%m-%d"] == hits_before + 1
@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from shmessy import Shmessy, TypesHandler
+from shmessy.scheduler import TypesScheduler
+from shmessy.types.boolean import BooleanType
+from shmessy.types.datetime_ import DatetimeType
+from shmessy.types.integer import IntegerType
+
+
+def test_scheduled_inference_same_as_default():
+    df = pd.DataFrame(
+        {
+            "booleans": ["yes", "no"] * 5,
+            "integers": [str(x) for x in range(10)],
+            "floats": [x / 3 for x in range(10)],
+            "dates": ["2020-04-11"] * 10,
+            "emails": ["a@example.com"] * 10,
+            "strings": ["hello"] * 10,
+        }
+    )
+    default_handler = TypesHandler(types_to_ignore=[])
+    scheduled_handler = TypesHandler(types_to_ignore=[], scheduler=TypesScheduler())
+    for _ in range(3):  # Once learned, the order changes
+        for column in df:
+            assert scheduled_handler.infer_field(
+                column, df[column].values
+            ) == default_handler.infer_field(column, df[column].values)
+
+
+def test_cheap_and_useful_checks_first():
+    scheduler = TypesScheduler()
+    scheduler.record_check(type_name="Datetime", seconds=1.0, useful=True)
+    scheduler.record_check(type_name="Integer", seconds=0.01, useful=True)
+    scheduler.record_check(type_name="Boolean", seconds=0.01, useful=False)
+
+    order = [
+        x.name for x in scheduler.order([BooleanType(), DatetimeType(), IntegerType()])
+    ]
+    assert order.index("Integer") < order.index("Boolean") < order.index("Datetime")
+
+
+def test_checks_which_cost_more_than_they_save_are_skipped():
+    scheduler = TypesScheduler()
+    for _ in range(TypesScheduler.MIN_CHECKS):
+        # Integer.rejects costs as much as its validation
+        scheduler.record_check(type_name="Integer", seconds=0.1, useful=True)
+        scheduler.record_validation(type_name="Integer", seconds=0.1)
+        scheduler.record_check(type_name="Boolean", seconds=0.01, useful=True)
+        scheduler.record_validation(type_name="Boolean", seconds=0.1)
+
+    assert [x.name for x in scheduler.order([BooleanType(), IntegerType()])] == ["Boolean"]
+
+
+def test_rejected_types_are_not_validated():
+    scheduler = TypesScheduler()
+    handler = TypesHandler(types_to_ignore=[], scheduler=scheduler)
+    assert handler.infer_field("a", np.array(["1", "2", "3"], dtype=object)).inferred_type == "Integer"
+
+    stats = scheduler.get_stats()
+    assert stats["Boolean"]["useful_checks"] == 1
+    assert stats["Boolean"]["validations"] == 0
+    assert stats["Float"]["useful_checks"] == 0  # Integer was matched first
+    assert stats["Integer"]["validations"] == 1
+
+
+def test_stats_persistence(tmp_files_folder):
+    stats_path = (tmp_files_folder / "scheduler.json").as_posix()
+    shmessy = Shmessy(scheduler_stats_path=stats_path)
+    shmessy.infer_schema(pd.DataFrame({"a": np.array(["1", "2", "3"], dtype=object)}))
+
+    stats = TypesScheduler(stats_path=stats_path).get_stats()
+    assert stats["Boolean"]["checks"] == 1
+    assert stats["Boolean"]["useful_checks"] == 1
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+import pytest
+from parametrization import Parametrization
+
+from shmessy import Shmessy
+from shmessy.schema import InferredField
+from shmessy.types.string import StringType
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Strings with nulls", data=["hello", None, "world", float("nan")])
+@Parametrization.case(name="Mixed objects", data=["hello", 1, 1.5, b"bytes", True])
+@Parametrization.case(name="Floats", data=[0.1 + 0.2, 1e20, float("nan")])
+def test_string_cast_same_as_str(data):
+    column = pd.Series(data)
+    casted = StringType().cast_column(column, InferredField(inferred_type="String"))
+    assert casted.tolist() == [str(x) for x in data]
+
+
+def test_string_storage_keeps_nulls():
+    shmessy = Shmessy(string_storage="python")
+    df = pd.DataFrame({"test_column": ["hello", None, "world", "hello"]})
+    fixed_df = shmessy.fix_schema(df)
+
+    assert fixed_df["test_column"].dtype == pd.StringDtype("python")
+    assert fixed_df["test_column"].isna().tolist() == [False, True, False, False]
+
+
+def test_pyarrow_string_storage():
+    pytest.importorskip("pyarrow")
+    shmessy = Shmessy(string_storage="pyarrow")
+    df = pd.DataFrame({"test_column": ["hello", np.nan, "world"]})
+    fixed_df = shmessy.fix_schema(df)
+
+    assert fixed_df["test_column"].dtype == pd.StringDtype("pyarrow")
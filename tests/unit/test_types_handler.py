@@ -0,0 +1,122 @@
+import numpy as np
+import pandas as pd
+from parametrization import Parametrization
+
+from shmessy import Shmessy, TypesHandler
+from shmessy.types_handler import _cast_distinct_values, _distinct_values
+
+
+def test_distinct_values_keeps_null_types():
+    data = np.array([None, "a", float("nan"), "a", pd.NaT, "b", None], dtype=object)
+    values, counts = _distinct_values(data)
+
+    assert values[1] == "a"
+    assert [type(x) for x in values] == [type(None), str, float, type(pd.NaT), str]
+    assert counts.tolist() == [2, 2, 1, 1, 1]
+
+
+def test_infer_field_on_repeated_values(type_handler):
+    data = np.array(["2022-01-05", "2022-01-06", None] * 10_000, dtype=object)
+    field = type_handler.infer_field(field_name="test_column", data=data)
+
+    assert field.inferred_type == "Date"
+    assert field.inferred_pattern == "%Y-%m-%d"
+
+
+def test_cast_distinct_values_same_as_apply():
+    column = pd.Series(["yes", "no", None, "yes", float("nan"), "no"], name="col", index=range(10, 16))
+    result = _cast_distinct_values(column, lambda x: str(x).upper())
+
+    pd.testing.assert_series_equal(result, column.apply(lambda x: str(x).upper()))
+    assert result.tolist() == ["YES", "NO", "NONE", "YES", "NAN", "NO"]
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Free text", data=["hello", "world", None, "1.2.3.4"])
+@Parametrization.case(name="Integers", data=[15, 1230, 1, 154, 330])
+@Parametrization.case(name="Numeric strings", data=["15", "1230", "1.5"])
+@Parametrization.case(name="Booleans", data=["yes", "no", "no"])
+@Parametrization.case(name="Dates", data=["12/21/2022", "03/11/2022", None])
+@Parametrization.case(name="Datetimes", data=["2022-12-30 10:11:12", "2022-12-31 10:11:12"])
+@Parametrization.case(name="Unix timestamps", data=[1706024027, 1706024052, 999999999])
+@Parametrization.case(name="IP addresses", data=["1.2.3.4", "10.0.0.1"])
+@Parametrization.case(name="Only nulls", data=[None, float("nan")])
+def test_single_pass_inference_same_as_cascade(data):
+    data = np.array(data * 100, dtype=object)
+    cascade = TypesHandler(types_to_ignore=[])
+    single_pass = TypesHandler(types_to_ignore=[], single_pass=True)
+
+    assert single_pass.infer_field("col", data) == cascade.infer_field("col", data)
+
+
+AMBIGUOUS_DATES = ["%02d/%02d/2022" % (x, y) for x in range(1, 13) for y in range(1, 13)]
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Late float", data=[str(x) for x in range(1000)] + ["1.5"], expected=("Float", None))
+@Parametrization.case(name="Late day", data=AMBIGUOUS_DATES + ["01/13/2022"], expected=("Date", "%m/%d/%Y"))
+@Parametrization.case(name="Late month", data=AMBIGUOUS_DATES + ["13/01/2022"], expected=("Date", "%d/%m/%Y"))
+@Parametrization.case(name="Late text", data=[f"a{x}@b.com" for x in range(500)] + ["hello"], expected=("String", None))
+def test_single_pass_decided_by_the_whole_sample(data, expected):
+    data = np.array(data, dtype=object)
+    field = TypesHandler(types_to_ignore=[], single_pass=True).infer_field("col", data)
+
+    assert (field.inferred_type, field.inferred_pattern) == expected
+    assert field == TypesHandler(types_to_ignore=[]).infer_field("col", data)
+
+
+def test_profile_attached_to_field():
+    data = np.array(["hello world", "foo: bar", None], dtype=object)
+    field = TypesHandler(types_to_ignore=[]).infer_field("col", data)
+
+    assert field.inferred_type == "String"
+    assert field.profile.char_classes == ["alpha", "space", "punctuation"]
+    assert field.profile.max_length == 11
+    assert field.profile.nulls_count == 1
+    assert not field.profile.has_at_sign
+    assert field.profile.skipped_types == [
+        "Boolean", "Date", "Datetime", "UnixTimestamp", "Email", "IPv4", "Integer"
+    ]
+
+
+def test_numeric_column_is_not_profiled():
+    field = TypesHandler(types_to_ignore=[]).infer_field("col", np.array([1, 2, 3]))
+    assert field.profile is None
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Zeros and ones", data=[0, 1, 1, 0])
+@Parametrization.case(name="Zeros and ones with nan", data=[0.0, 1.0, float("nan")])
+@Parametrization.case(name="Integers", data=[15, 1230, 1, 154, 330])
+@Parametrization.case(name="Round floats", data=[15.0, 1230.0, 1.0])
+@Parametrization.case(name="Floats", data=[1.5, 2.25, float("nan")])
+@Parametrization.case(name="Infinite floats", data=[1.5, float("inf")])
+@Parametrization.case(name="Out of bigint boundaries", data=[1.0, 2.0**63])
+@Parametrization.case(name="Unix timestamps", data=[1706024027, 1706024052, 999999999])
+@Parametrization.case(name="Unix timestamps ms", data=[1706024027000, 1706024052000])
+@Parametrization.case(name="Unix timestamps out of range", data=[1706024027, 5006024052])
+@Parametrization.case(name="Only nan", data=[float("nan")])
+def test_numeric_fast_path_same_as_per_value(data):
+    data = np.array(data)
+    handler = TypesHandler(types_to_ignore=[])
+
+    fast = handler.infer_field("col", data)
+    per_value = handler.infer_field("col", data.astype(object))
+    assert (fast.inferred_type, fast.inferred_pattern) == (
+        per_value.inferred_type,
+        per_value.inferred_pattern,
+    )
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Integers", data=["1", "2", "x", "1,234", None, "1.5"], expected_nulled=2)
+@Parametrization.case(name="Floats", data=["1.5", "2", "x", "1,234.5", None], expected_nulled=1)
+@Parametrization.case(name="Dates", data=["2020-01-01", "2020-02-01", "2020-13-01", None], expected_nulled=1)
+@Parametrization.case(name="Booleans", data=["yes", "no", "maybe", "YES"], expected_nulled=1)
+def test_fallback_to_null_counts_nulled_values(data, expected_nulled):
+    shmessy = Shmessy(fallback_to_null=True, use_random_sample=False, sample_size=2)
+    df = pd.DataFrame({"test_column": data})
+    fixed_df = shmessy.fix_schema(df)
+
+    assert shmessy.get_inferred_schema().columns[0].nulled_values_count == expected_nulled
+    assert fixed_df["test_column"].isna().sum() == expected_nulled + pd.isna(data).sum()
@@ -30,6 +30,22 @@ from shmessy import Shmessy
     expected_shmessy_type="UnixTimestamp",
     expected_numpy_type=np.dtype("datetime64")
 )
+@Parametrization.case(
+    name="UnixTimestamp seconds as strings",
+    df_data={
+        "test_column": ["1706024027", "1706024052", None, "1704024052"]
+    },
+    expected_shmessy_type="UnixTimestamp",
+    expected_numpy_type=np.dtype("datetime64")
+)
+@Parametrization.case(
+    name="UnixTimestamp seconds with a year out of range",
+    df_data={
+        "test_column": ["1706024027", "1706024052", "5706024052"]
+    },
+    expected_shmessy_type="Integer",
+    expected_numpy_type=np.dtype("int64")
+)
 def test_datetime_type(df_data, expected_shmessy_type, expected_numpy_type):
     shmessy = Shmessy()
     df = pd.DataFrame(df_data)
@@ -38,3 +54,12 @@ def test_datetime_type(df_data, expected_shmessy_type, expected_numpy_type):
 
     assert inferred_schema.columns[0].inferred_type == expected_shmessy_type
     assert fixed_df["test_column"].dtype.type == expected_numpy_type.type
+
+
+@Parametrization.autodetect_parameters()
+@Parametrization.case(name="Numbers", data=[1153642360000000, 1153642361000000])
+@Parametrization.case(name="Strings", data=["1153642360000000", "1153642361000000"])
+def test_16_digits_timestamps_are_microseconds(data):
+    fixed_df = Shmessy().fix_schema(pd.DataFrame({"test_column": data}))
+
+    assert fixed_df["test_column"].iloc[0] == pd.Timestamp("2006-07-23 08:12:40")